@@ -3,48 +3,111 @@ import { NextRequest, NextResponse } from "next/server"
 // Python 크롤러 서버 URL (환경변수로 설정 가능)
 const CRAWLER_API_URL = process.env.CRAWLER_API_URL || "http://localhost:8000"
 
+// 크롤러 서버 응답 캐시 (키별 마지막 ETag와 본문) - 다음 요청에 If-None-Match를 보내고 304면 그대로 재사용
+// 키는 경로와 본문을 바꾸는 파라미터(dedupe)만으로 만들고 (deadline 등은 제외), 최근 사용 순으로 최대 개수만 유지
+const MAX_UPSTREAM_CACHE = 32
+const upstreamCache = new Map<string, { etag: string; body: any }>()
+
+function rememberUpstream(key: string, entry: { etag: string; body: any }) {
+  // Map은 삽입 순서를 유지하므로 다시 넣으면 가장 최근 항목이 됨
+  upstreamCache.delete(key)
+  upstreamCache.set(key, entry)
+  while (upstreamCache.size > MAX_UPSTREAM_CACHE) {
+    upstreamCache.delete(upstreamCache.keys().next().value as string)
+  }
+}
+
+// 조건부 GET (gzip 압축 해제는 fetch가 처리). 실패 응답은 그대로 반환
+async function fetchCached(
+  url: string,
+  key: string
+): Promise<{ ok: true; body: any } | { ok: false; response: Response }> {
+  const cached = upstreamCache.get(key)
+  const headers: Record<string, string> = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip",
+  }
+  if (cached) headers["If-None-Match"] = cached.etag
+
+  const response = await fetch(url, { method: "GET", headers, cache: "no-store" })
+
+  if (response.status === 304 && cached) {
+    rememberUpstream(key, cached)
+    return { ok: true, body: cached.body }
+  }
+  if (!response.ok) {
+    return { ok: false, response }
+  }
+
+  const body = await response.json()
+  const etag = response.headers.get("etag")
+  if (etag) {
+    rememberUpstream(key, { etag, body })
+  } else {
+    upstreamCache.delete(key)
+  }
+  return { ok: true, body }
+}
+
 export async function GET(request: NextRequest) {
   const searchParams = request.nextUrl.searchParams
   const shopId = searchParams.get("shopId")
+  const stream = searchParams.get("stream") === "true"
+  const deadline = searchParams.get("deadline")
+  const dedupe = searchParams.get("dedupe") === "true"
 
   try {
-    if (shopId) {
-      // 특정 샵 크롤링 - Python 크롤러 서버로 요청
-      const response = await fetch(`${CRAWLER_API_URL}/api/crawl/${shopId}`, {
+    if (stream) {
+      // 모든 샵 크롤링 (NDJSON 스트리밍) - 샵별 결과를 받는 즉시 그대로 전달
+      const response = await fetch(`${CRAWLER_API_URL}/api/crawl/stream`, {
         method: "GET",
+      })
+
+      if (!response.ok || !response.body) {
+        return NextResponse.json({ error: "Crawl failed" }, { status: response.status })
+      }
+
+      return new Response(response.body, {
         headers: {
-          "Content-Type": "application/json",
+          "Content-Type": "application/x-ndjson",
+          "Cache-Control": "no-cache",
         },
       })
+    } else if (shopId) {
+      // 특정 샵 크롤링 - Python 크롤러 서버로 요청 (바뀌지 않았으면 304로 이전 본문 재사용)
+      const path = `/api/crawl/${encodeURIComponent(shopId)}`
+      const upstream = await fetchCached(`${CRAWLER_API_URL}${path}`, path)
 
-      if (!response.ok) {
-        const error = await response.json()
+      if (!upstream.ok) {
+        const error = await upstream.response.json()
         return NextResponse.json(
           { error: error.detail || "Crawl failed" },
-          { status: response.status }
+          { status: upstream.response.status }
         )
       }
 
-      const result = await response.json()
-      return NextResponse.json(result)
+      return NextResponse.json(upstream.body)
     } else {
-      // 모든 샵 크롤링 - Python 크롤러 서버로 요청
-      const response = await fetch(`${CRAWLER_API_URL}/api/crawl`, {
-        method: "GET",
-        headers: {
-          "Content-Type": "application/json",
-        },
-      })
+      // 모든 샵 크롤링 - Python 크롤러 서버로 요청 (deadline: 응답 마감 시간(초), 넘긴 샵은 부분 결과)
+      // dedupe: 여러 샵에 올라온 같은 동물을 대표 Pet 하나로 묶음
+      const params = new URLSearchParams()
+      if (deadline) params.set("deadline", deadline)
+      if (dedupe) params.set("dedupe", "true")
+      const query = params.toString() ? `?${params.toString()}` : ""
+      const upstream = await fetchCached(
+        `${CRAWLER_API_URL}/api/crawl${query}`,
+        dedupe ? "/api/crawl?dedupe=true" : "/api/crawl"
+      )
 
-      if (!response.ok) {
-        const error = await response.json()
+      if (!upstream.ok) {
+        const error = await upstream.response.json()
         return NextResponse.json(
           { error: error.detail || "Crawl failed" },
-          { status: response.status }
+          { status: upstream.response.status }
         )
       }
 
-      const data = await response.json()
+      const data = upstream.body
       
       // Python 서버 응답 형식을 Next.js 형식에 맞게 변환
       return NextResponse.json({
@@ -52,6 +115,8 @@ export async function GET(request: NextRequest) {
         results: data.results || [],
         failed: data.failed || [],
         total: data.total || 0,
+        duplicates: data.duplicates || 0,
+        version: data.version || 0,
       })
     }
   } catch (error: any) {
@@ -0,0 +1,36 @@
+import { NextRequest, NextResponse } from "next/server"
+
+// Python 크롤러 서버 URL (환경변수로 설정 가능)
+const CRAWLER_API_URL = process.env.CRAWLER_API_URL || "http://localhost:8000"
+
+// 썸네일 프록시 - Python 서버의 /api/images/{key} 응답을 캐시 헤더와 함께 그대로 전달
+export async function GET(request: NextRequest, { params }: { params: { key: string } }) {
+  try {
+    const response = await fetch(`${CRAWLER_API_URL}/api/images/${encodeURIComponent(params.key)}`, {
+      method: "GET",
+      redirect: "manual",
+    })
+
+    // 썸네일이 아직 없으면 원본 이미지로 리다이렉트
+    const location = response.headers.get("location")
+    if (response.status >= 300 && response.status < 400 && location) {
+      return NextResponse.redirect(location, {
+        status: response.status,
+        headers: { "Cache-Control": "no-store" },
+      })
+    }
+
+    if (!response.ok || !response.body) {
+      return new Response(null, { status: response.status })
+    }
+
+    return new Response(response.body, {
+      headers: {
+        "Content-Type": response.headers.get("content-type") || "image/jpeg",
+        "Cache-Control": response.headers.get("cache-control") || "public, max-age=31536000, immutable",
+      },
+    })
+  } catch (error: any) {
+    return new Response(null, { status: 503 })
+  }
+}
@@ -32,7 +32,7 @@ export function PetCard({ pet }: PetCardProps) {
     >
       <div className="relative overflow-hidden">
         <Image
-          src={pet.image || "/placeholder.svg"}
+          src={pet.thumbnail || pet.image || "/placeholder.svg"}
           alt={pet.name}
           width={300}
           height={300}
@@ -0,0 +1,92 @@
+"""
+파싱 모드 벤치마크 (full vs fast)
+각 샵의 목록 페이지를 두 모드로 반복 파싱하여 평균 시간과 결과 개수를 비교
+
+사용법 (crawler 폴더에서):
+    python benchmarks/parse_modes.py                    # 실제 사이트에서 페이지를 한 번 받아 측정
+    python benchmarks/parse_modes.py --html-dir DIR     # DIR/{shop_id}.html 파일로 측정
+    python benchmarks/parse_modes.py --json out.json    # 결과를 JSON으로 저장
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# crawler 폴더를 Python path에 추가
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from engine import parse_page
+from fetcher import close_client, fetch_text
+from registry import default_registry
+
+registry = default_registry()
+ALL_SPECS = [registry.module(shop_id).SPEC for shop_id in registry]
+
+
+async def load_pages(html_dir: Path = None) -> dict:
+    """
+    샵별 목록 페이지 HTML 준비 (파일 또는 실제 사이트)
+    """
+    pages = {}
+    for spec in ALL_SPECS:
+        if html_dir is not None:
+            path = html_dir / f"{spec.shop_id}.html"
+            if path.exists():
+                pages[spec.shop_id] = path.read_text(encoding="utf-8")
+            continue
+        try:
+            pages[spec.shop_id] = await fetch_text(spec.url)
+        except Exception as e:
+            print(f"{spec.shop_id}: 페이지를 가져오지 못함 ({e})")
+    await close_client()
+    return pages
+
+
+def time_mode(spec, html: str, mode: str, iterations: int) -> dict:
+    """
+    한 모드로 반복 파싱하여 평균 시간(ms)과 결과 개수 측정
+    """
+    count = len(parse_page(spec, html, spec.url, mode=mode)[0])
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse_page(spec, html, spec.url, mode=mode)
+    elapsed = (time.perf_counter() - start) / iterations
+    return {"ms": round(elapsed * 1000, 3), "items": count}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="full/fast 파싱 모드 비교")
+    parser.add_argument("--html-dir", type=Path, default=None)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--json", type=Path, default=None)
+    args = parser.parse_args()
+
+    pages = asyncio.run(load_pages(args.html_dir))
+    results = []
+    print(f"{'shop':<18}{'bytes':>10}{'full ms':>10}{'fast ms':>10}{'speedup':>9}  items")
+    for spec in ALL_SPECS:
+        html = pages.get(spec.shop_id)
+        if html is None:
+            continue
+        full = time_mode(spec, html, "full", args.iterations)
+        fast = time_mode(spec, html, "fast", args.iterations)
+        speedup = full["ms"] / fast["ms"] if fast["ms"] else 0.0
+        results.append({
+            "shopId": spec.shop_id,
+            "bytes": len(html.encode("utf-8")),
+            "full": full,
+            "fast": fast,
+            "speedup": round(speedup, 2),
+        })
+        items = f"{full['items']}" if full["items"] == fast["items"] else f"{full['items']} != {fast['items']}"
+        print(f"{spec.shop_id:<18}{len(html):>10}{full['ms']:>10.2f}{fast['ms']:>10.2f}{speedup:>8.1f}x  {items}")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+실제 사이트의 목록 페이지를 벤치마크 픽스처로 저장
+fixtures/{shop_id}.html (첫 페이지)과 --pages 2 이상이면 fixtures/{shop_id}.p{N}.html
+
+사용법 (crawler 폴더에서):
+    python benchmarks/record_fixtures.py                  # 모든 샵
+    python benchmarks/record_fixtures.py zooseyo petkas   # 일부 샵
+    python benchmarks/record_fixtures.py --pages 2
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# crawler 폴더를 Python path에 추가
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from fetcher import close_client, fetch_text
+from registry import default_registry
+
+FIXTURES_DIR = current_dir / "fixtures"
+
+
+async def record(shop_ids, pages: int, out_dir: Path):
+    registry = default_registry()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        for shop_id in shop_ids or list(registry):
+            spec = registry.module(shop_id).SPEC
+            urls = [spec.url]
+            if pages > 1 and spec.page_url:
+                urls += spec.generated_page_urls()[:pages - 1]
+            for page, url in enumerate(urls, start=1):
+                name = f"{shop_id}.html" if page == 1 else f"{shop_id}.p{page}.html"
+                try:
+                    html = await fetch_text(url, timeout=spec.timeout)
+                except Exception as e:
+                    print(f"{shop_id}: {url} 요청 실패 ({e})")
+                    break
+                (out_dir / name).write_text(html, encoding="utf-8")
+                print(f"{shop_id}: {url} -> {name} ({len(html.encode('utf-8'))} bytes)")
+    finally:
+        await close_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 페이지를 벤치마크 픽스처로 저장")
+    parser.add_argument("shop_ids", nargs="*")
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--out", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+    asyncio.run(record(args.shop_ids, args.pages, args.out))
+
+
+if __name__ == "__main__":
+    main()
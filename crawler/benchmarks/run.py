@@ -0,0 +1,261 @@
+"""
+오프라인 벤치마크 모음 (실제 사이트에 접속하지 않음)
+fixtures/{shop_id}.html 픽스처와 스텁 HTTP 서버로 다음 시나리오를 측정하고 JSON으로 저장
+- parse: 샵별 목록 페이지 파싱 처리량
+- e2e: /api/crawl 전체 지연 시간 (cold: 모든 캐시 비움 / force: 결과 캐시만 무시 / cached: 결과 캐시 사용)
+- concurrency: 스케줄러 동시 실행 수별 /api/crawl?force=true 지연 시간
+- parse-pool: 파싱 프로세스 수별 전체 픽스처 파싱 처리량 (0 = 현재 프로세스)
+
+사용법 (crawler 폴더에서):
+    python benchmarks/run.py                                  # 모든 시나리오
+    python benchmarks/run.py --scenarios parse e2e --json out.json
+    python benchmarks/run.py --delay 0.05 --levels 1 2 4 8    # 응답 지연 50ms, 동시 실행 수 목록
+    python benchmarks/run.py --scenarios parse-pool --workers 0 1 2 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# crawler 폴더를 Python path에 추가
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+# 벤치마크가 실제 저장소/백그라운드 갱신에 영향을 주지 않도록 import 전에 설정
+os.environ.setdefault("CRAWLER_DB_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+os.environ["CRAWLER_AUTO_REFRESH"] = "0"
+
+import engine
+import fetcher
+import parse_pool
+from registry import default_registry
+from stub_server import FIXTURES_DIR, StubServer
+
+SCENARIOS = ("parse", "e2e", "concurrency", "parse-pool")
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    지연 시간 목록(초)의 요약 (ms)
+    """
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        index = min(len(ordered) - 1, max(0, round(p * (len(ordered) - 1))))
+        return ordered[index]
+
+    return {
+        "n": len(ordered),
+        "meanMs": round(statistics.fmean(ordered) * 1000, 3),
+        "p50Ms": round(pct(0.50) * 1000, 3),
+        "p95Ms": round(pct(0.95) * 1000, 3),
+        "maxMs": round(ordered[-1] * 1000, 3),
+    }
+
+
+def load_specs(registry) -> Dict[str, object]:
+    return {shop_id: registry.module(shop_id).SPEC for shop_id in registry}
+
+
+def bench_parse(specs: Dict[str, object], iterations: int) -> List[dict]:
+    """
+    샵별 픽스처를 반복 파싱하여 처리량 측정 (현재 CRAWLER_PARSE_MODE 기준)
+    """
+    results = []
+    for shop_id, spec in specs.items():
+        path = FIXTURES_DIR / f"{shop_id}.html"
+        if not path.exists():
+            continue
+        html = path.read_text(encoding="utf-8")
+        items = len(engine.parse_page(spec, html, spec.url)[0])
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            engine.parse_page(spec, html, spec.url)
+            samples.append(time.perf_counter() - start)
+        mean = statistics.fmean(samples)
+        results.append({
+            "shopId": shop_id,
+            "bytes": len(html.encode("utf-8")),
+            "items": items,
+            "pagesPerSec": round(1 / mean, 1) if mean else 0.0,
+            "itemsPerSec": round(items / mean, 1) if mean else 0.0,
+            **summarize(samples),
+        })
+        print(f"parse  {shop_id:<18}{results[-1]['meanMs']:>9.2f} ms  {items:>4} items")
+    return results
+
+
+def bench_parse_pool(specs: Dict[str, object], iterations: int, levels: List[int]) -> List[dict]:
+    """
+    모든 샵 픽스처를 iterations번씩 파싱하는 처리량 (프로세스 수별, 0이면 현재 프로세스에서 파싱)
+    """
+    jobs = []
+    for shop_id, spec in specs.items():
+        path = FIXTURES_DIR / f"{shop_id}.html"
+        if path.exists():
+            jobs.append((shop_id, path.read_bytes(), "utf-8", spec.url))
+    jobs = jobs * iterations
+    if not jobs:
+        return []
+
+    results = []
+    for workers in levels:
+        if workers == 0:
+            start = time.perf_counter()
+            for shop_id, content, encoding, url in jobs:
+                engine.parse_page_records(specs[shop_id], content.decode(encoding), url)
+            elapsed = time.perf_counter() - start
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=parse_pool._init_worker) as pool:
+                # 프로세스 시작 시간은 제외
+                [future.result() for future in [pool.submit(parse_pool._warm_up) for _ in range(workers)]]
+                start = time.perf_counter()
+                list(pool.map(parse_pool._parse_in_worker, *zip(*jobs)))
+                elapsed = time.perf_counter() - start
+        results.append({
+            "workers": workers,
+            "pages": len(jobs),
+            "seconds": round(elapsed, 3),
+            "pagesPerSec": round(len(jobs) / elapsed, 1) if elapsed else 0.0,
+        })
+        print(f"pool   {workers:<18}{results[-1]['pagesPerSec']:>9.1f} pages/s")
+    return results
+
+
+def clear_caches(main):
+    """
+    결과 캐시, 파싱 결과 캐시, 조건부 요청 캐시를 모두 비움 (cold 측정용)
+    """
+    main.result_cache.invalidate()
+    engine._parsed_pages.clear()
+    fetcher._pages.clear()
+
+
+def timed_get(client, url: str) -> float:
+    start = time.perf_counter()
+    response = client.get(url)
+    elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    return elapsed
+
+
+def bench_e2e(main, iterations: int) -> dict:
+    """
+    /api/crawl 전체 지연 시간
+    """
+    from fastapi.testclient import TestClient
+
+    samples = {"cold": [], "force": [], "cached": []}
+    with TestClient(main.app) as client:
+        for _ in range(iterations):
+            clear_caches(main)
+            samples["cold"].append(timed_get(client, "/api/crawl?force=true"))
+        for _ in range(iterations):
+            samples["force"].append(timed_get(client, "/api/crawl?force=true"))
+        for _ in range(iterations):
+            samples["cached"].append(timed_get(client, "/api/crawl"))
+        total = client.get("/api/crawl").json()["total"]
+    result = {name: summarize(values) for name, values in samples.items()}
+    result["pets"] = total
+    for name in ("cold", "force", "cached"):
+        print(f"e2e    {name:<18}{result[name]['p50Ms']:>9.2f} ms (p50)  {result[name]['p95Ms']:>9.2f} ms (p95)")
+    return result
+
+
+def bench_concurrency(main, levels: List[int], per_host_limit: int, iterations: int) -> List[dict]:
+    """
+    스케줄러 동시 실행 수별 cold /api/crawl 지연 시간
+    """
+    from fastapi.testclient import TestClient
+    from scheduler import CrawlScheduler
+
+    original = main.scheduler
+    results = []
+    try:
+        for level in levels:
+            main.scheduler = CrawlScheduler(max_concurrency=level, per_host_limit=per_host_limit)
+            samples = []
+            with TestClient(main.app) as client:
+                for _ in range(iterations):
+                    clear_caches(main)
+                    samples.append(timed_get(client, "/api/crawl?force=true"))
+            results.append({"maxConcurrency": level, **summarize(samples)})
+            print(f"conc   {level:<18}{results[-1]['p50Ms']:>9.2f} ms (p50)")
+    finally:
+        main.scheduler = original
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 크롤러 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--iterations", type=int, default=20, help="parse 반복 횟수")
+    parser.add_argument("--requests", type=int, default=5, help="e2e/concurrency 요청 횟수")
+    parser.add_argument("--delay", type=float, default=0.02, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--per-host-limit", type=int, default=1)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4],
+                        help="parse-pool 파싱 프로세스 수 목록")
+    parser.add_argument("--throttle", action="store_true",
+                        help="샵별 요청 간격(REQUEST_INTERVAL)을 그대로 적용")
+    parser.add_argument("--json", type=Path, default=None)
+    args = parser.parse_args()
+
+    registry = default_registry()
+    specs = load_specs(registry)
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parseMode": engine.PARSE_MODE,
+            "delay": args.delay,
+            "throttle": args.throttle,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+    }
+
+    if "parse" in args.scenarios:
+        report["parse"] = bench_parse(specs, args.iterations)
+
+    if "parse-pool" in args.scenarios:
+        report["environment"]["cpus"] = os.cpu_count()
+        report["parsePool"] = bench_parse_pool(specs, args.iterations, args.workers)
+
+    if "e2e" in args.scenarios or "concurrency" in args.scenarios:
+        # 명세가 모두 로드된 뒤에 요청 간격을 0으로 (명세 생성 시 샵별 간격이 설정됨)
+        if not args.throttle:
+            fetcher.rate_limiter.default_interval = 0.0
+            for shop_id in registry:
+                fetcher.rate_limiter.configure(registry.host(shop_id), 0.0)
+        server = StubServer(delay=args.delay).start()
+        fetcher.set_url_rewriter(fetcher.prefix_rewriter(server.url))
+        try:
+            import main as app_main
+            if "e2e" in args.scenarios:
+                report["e2e"] = bench_e2e(app_main, args.requests)
+            if "concurrency" in args.scenarios:
+                report["concurrency"] = bench_concurrency(
+                    app_main, args.levels, args.per_host_limit, args.requests)
+        finally:
+            fetcher.set_url_rewriter(None)
+            server.stop()
+        report["stubRequests"] = server.requests
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
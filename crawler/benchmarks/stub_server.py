@@ -0,0 +1,161 @@
+"""
+벤치마크용 스텁 HTTP 서버
+fixtures/{shop_id}.html을 /{호스트}/{경로} 주소로 제공 (fetcher.prefix_rewriter와 짝)
+?page=N 요청은 fixtures/{shop_id}.p{N}.html이 있으면 그 파일을, 없으면 첫 페이지를 반환
+
+사용법 (crawler 폴더에서):
+    python benchmarks/stub_server.py --port 8765 --delay 0.05
+    CRAWLER_STUB_URL=http://127.0.0.1:8765 python main.py
+"""
+import argparse
+import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+# crawler 폴더를 Python path에 추가
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from crawlers import BUILTIN_CRAWLERS
+
+FIXTURES_DIR = current_dir / "fixtures"
+
+
+def host_fixtures() -> Dict[str, str]:
+    """
+    호스트 -> 샵 ID (기본 크롤러 메타데이터 기준)
+    """
+    return {urlparse(base_url).netloc: shop_id for shop_id, _, base_url in BUILTIN_CRAWLERS}
+
+
+class StubServer:
+    """
+    별도 스레드에서 실행하는 스텁 서버
+    - delay: 응답 전 대기 시간 (초, 네트워크 지연 흉내)
+    - etag: True면 ETag를 보내고 If-None-Match가 같으면 304 응답
+    """
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR, host: str = "127.0.0.1",
+                 port: int = 0, delay: float = 0.0, etag: bool = False):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.delay = delay
+        self.etag = etag
+        self.hosts = host_fixtures()
+        self._bodies: Dict[str, bytes] = {}
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fixture(self, host: str, query: str) -> Optional[bytes]:
+        """
+        요청 호스트/쿼리에 해당하는 픽스처 본문 (없으면 None)
+        """
+        shop_id = self.hosts.get(host)
+        if shop_id is None:
+            return None
+        names = []
+        page = parse_qs(query).get("page")
+        if page:
+            names.append(f"{shop_id}.p{page[0]}.html")
+        names.append(f"{shop_id}.html")
+        for name in names:
+            body = self._bodies.get(name)
+            if body is None:
+                path = self.fixtures_dir / name
+                if not path.exists():
+                    continue
+                body = self._bodies[name] = path.read_bytes()
+            return body
+        return None
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stub.requests += 1
+                parsed = urlparse(self.path)
+                host, _, _ = parsed.path.lstrip("/").partition("/")
+                body = stub.fixture(host, parsed.query)
+                if stub.delay:
+                    time.sleep(stub.delay)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                etag = f'"{hashlib.sha1(body).hexdigest()}"' if stub.etag else None
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        """
+        현재 스레드에서 실행 (CLI용)
+        """
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def start(self):
+        """
+        별도 스레드에서 실행
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="픽스처 HTML을 제공하는 스텁 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--etag", action="store_true")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    server = StubServer(args.fixtures, port=args.port, delay=args.delay, etag=args.etag)
+    print(f"스텁 서버 실행 중: {server.url} (CRAWLER_STUB_URL={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+크롤링 결과 캐시 (TTL + stale-while-revalidate)
+"""
+import time
+from typing import Any, Dict, Optional
+
+
+class CacheEntry:
+    """
+    캐시 항목 (저장 시각과 함께 보관)
+    """
+
+    def __init__(self, value: Any, stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class ResultCache:
+    """
+    키(샵 ID)별 결과 캐시
+    - TTL 이내: 신선(fresh) -> 그대로 반환
+    - TTL 초과: 오래됨(stale) -> 그대로 반환하되 호출 측에서 백그라운드 갱신
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries: Dict[str, CacheEntry] = {}
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self._entries.get(key)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age < self.ttl
+
+    def set(self, key: str, value: Any):
+        self._entries[key] = CacheEntry(value, time.monotonic())
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        특정 키 또는 전체 캐시 삭제
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -0,0 +1,183 @@
+"""
+Pet 조회용 메모리 인덱스
+필터 필드별 역색인과 정렬 필드별 정렬 순서를 미리 만들어 두고
+/api/pets 조회를 선형 탐색 없이 처리
+"""
+import base64
+import json
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models import Pet
+
+# 역색인을 만드는 필터 필드 (정확히 일치)
+FILTER_FIELDS = ("type", "breed", "shopId", "gender", "location")
+
+# 정렬 가능한 필드
+SORT_FIELDS = ("price", "crawledAt", "name")
+
+MAX_LIMIT = 100
+
+
+def encode_cursor(key: tuple) -> str:
+    """
+    정렬 키 (값, id)를 불투명한 커서 문자열로 변환
+    """
+    raw = json.dumps(list(key), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    커서 문자열을 정렬 키로 복원 (형식이 잘못되면 ValueError)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, pet_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return (value, pet_id)
+
+
+class PetIndex:
+    """
+    Pet 메모리 인덱스
+    - 필터: 필드 값 -> id 집합 (역색인), 가격 범위는 가격 정렬 순서에서 이분 탐색
+    - 정렬: 필드별 (값, id) 오름차순 키 목록과 id -> 순위 매핑 (변경 후 첫 조회 시 재계산)
+    - 페이지네이션: 마지막 항목의 (값, id)를 커서로 사용 (목록이 바뀌어도 중복/누락 없음)
+    """
+
+    def __init__(self):
+        self._pets: Dict[str, Pet] = {}
+        self._shop_ids: Dict[str, Set[str]] = {}
+        self._inverted: Dict[str, Dict[str, Set[str]]] = {name: {} for name in FILTER_FIELDS}
+        self._sorted: Dict[str, Tuple[List[tuple], Dict[str, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pets)
+
+    def load(self, pets: Iterable[Pet]):
+        """
+        저장소에서 읽은 Pet 전체로 인덱스 초기화
+        """
+        by_shop: Dict[str, List[Pet]] = {}
+        for pet in pets:
+            by_shop.setdefault(pet.shopId, []).append(pet)
+        for shop_id, shop_pets in by_shop.items():
+            self.replace_shop(shop_id, shop_pets)
+
+    def replace_shop(self, shop_id: str, pets: List[Pet]):
+        """
+        샵의 Pet 목록을 최신 크롤링 결과로 교체
+        """
+        for pet_id in self._shop_ids.pop(shop_id, set()):
+            self._remove(pet_id)
+        ids = set()
+        for pet in pets:
+            if pet.id in self._pets:
+                self._remove(pet.id)
+            self._pets[pet.id] = pet
+            ids.add(pet.id)
+            for name in FILTER_FIELDS:
+                self._inverted[name].setdefault(getattr(pet, name), set()).add(pet.id)
+        self._shop_ids[shop_id] = ids
+        self._sorted.clear()
+
+    def _remove(self, pet_id: str):
+        pet = self._pets.pop(pet_id, None)
+        if pet is None:
+            return
+        for name in FILTER_FIELDS:
+            bucket = self._inverted[name].get(getattr(pet, name))
+            if bucket is not None:
+                bucket.discard(pet_id)
+                if not bucket:
+                    del self._inverted[name][getattr(pet, name)]
+
+    def _sorted_view(self, field: str) -> Tuple[List[tuple], Dict[str, int]]:
+        view = self._sorted.get(field)
+        if view is None:
+            keys = sorted((getattr(pet, field), pet.id) for pet in self._pets.values())
+            rank = {key[1]: i for i, key in enumerate(keys)}
+            view = (keys, rank)
+            self._sorted[field] = view
+        return view
+
+    def _price_range(self, min_price: Optional[int], max_price: Optional[int]) -> Tuple[int, int]:
+        """
+        가격 정렬 순서에서 범위에 해당하는 순위 구간 [start, end)
+        """
+        keys, _ = self._sorted_view("price")
+        start = 0 if min_price is None else bisect_left(keys, (min_price, ""))
+        end = len(keys) if max_price is None else bisect_left(keys, (max_price + 1, ""))
+        return start, end
+
+    def query(
+        self,
+        filters: Dict[str, Optional[str]],
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        sort: str = "-crawledAt",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> dict:
+        """
+        필터/정렬/커서 페이지네이션 조회
+        sort: 필드명 (오름차순) 또는 "-필드명" (내림차순)
+        """
+        descending = sort.startswith("-")
+        field = sort.lstrip("-")
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Invalid sort field: {field}")
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        # 1. 역색인 교집합 (작은 집합부터)
+        candidates: Optional[Set[str]] = None
+        buckets = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            buckets.append(self._inverted[name].get(value, set()))
+        if buckets:
+            buckets.sort(key=len)
+            candidates = set(buckets[0])
+            for bucket in buckets[1:]:
+                candidates &= bucket
+
+        # 2. 가격 범위 (가격 정렬 순서의 구간)
+        if min_price is not None or max_price is not None:
+            price_keys, _ = self._sorted_view("price")
+            start, end = self._price_range(min_price, max_price)
+            if candidates is None:
+                candidates = {key[1] for key in price_keys[start:end]}
+            else:
+                candidates = {
+                    pet_id for pet_id in candidates
+                    if (min_price is None or self._pets[pet_id].price >= min_price)
+                    and (max_price is None or self._pets[pet_id].price <= max_price)
+                }
+
+        # 3. 정렬 순위로 정렬 후 커서 이후 구간 선택
+        keys, rank = self._sorted_view(field)
+        if candidates is None:
+            ranks = range(len(keys))
+        else:
+            ranks = sorted(rank[pet_id] for pet_id in candidates)
+        total = len(ranks)
+
+        if descending:
+            end = len(ranks)
+            if cursor is not None:
+                end = bisect_left(ranks, bisect_left(keys, decode_cursor(cursor)))
+            page = [ranks[i] for i in range(end - 1, max(end - limit, 0) - 1, -1)]
+            has_more = end - limit > 0
+        else:
+            start = 0
+            if cursor is not None:
+                start = bisect_left(ranks, bisect_right(keys, decode_cursor(cursor)))
+            page = list(ranks[start:start + limit])
+            has_more = start + limit < len(ranks)
+
+        items = [self._pets[keys[r][1]] for r in page]
+        next_cursor = encode_cursor(keys[page[-1]]) if page and has_more else None
+        return {"items": items, "total": total, "nextCursor": next_cursor}
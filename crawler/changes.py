@@ -0,0 +1,211 @@
+"""
+크롤링 변경 이력 (버전별 추가/삭제/변경)
+저장소에 샵 결과를 저장할 때 이전 목록(활성 Pet)과 ID 기준으로 비교하여 변경이 있으면 버전을 하나 올리고 기록
+- 버전은 SQLite meta 테이블에 저장되어 서버를 다시 시작해도 계속 증가
+- /api/changes?since=N은 N 이후의 변경을 Pet별로 합쳐서 반환 (추가 후 삭제는 생략, 여러 번 변경은 처음 값 -> 마지막 값)
+- 오래된 변경은 CRAWLER_CHANGES_RETENTION 버전만 남기고 삭제 (since가 그보다 오래되면 reset=true)
+"""
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
+
+from models import Pet
+
+CHANGES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pet_changes (
+    version INTEGER NOT NULL,
+    shop_id TEXT NOT NULL,
+    pet_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    pet TEXT,
+    fields TEXT,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pet_changes_version ON pet_changes (version);
+"""
+
+# 변경으로 보는 필드 (crawledAt처럼 크롤링마다 바뀌는 값은 제외)
+TRACKED_FIELDS = (
+    "name", "breed", "age", "gender", "price", "location", "image", "type",
+    "description", "vaccinated", "registered", "detailUrl",
+)
+
+# 보관할 버전 수
+RETAIN_VERSIONS = int(os.getenv("CRAWLER_CHANGES_RETENTION", "1000"))
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+class PetChange(NamedTuple):
+    kind: str
+    pet_id: str
+    pet: Optional[Pet]
+    # 필드 -> (이전 값, 새 값)
+    fields: Dict[str, Tuple]
+
+
+def diff_pets(previous: Dict[str, Pet], current: List[Pet]) -> List[PetChange]:
+    """
+    이전 목록(ID -> Pet)과 새 목록 비교
+    """
+    changes = []
+    seen = set()
+    for pet in current:
+        seen.add(pet.id)
+        old = previous.get(pet.id)
+        if old is None:
+            changes.append(PetChange(ADDED, pet.id, pet, {}))
+            continue
+        fields = {
+            name: (getattr(old, name), getattr(pet, name))
+            for name in TRACKED_FIELDS
+            if getattr(old, name) != getattr(pet, name)
+        }
+        if fields:
+            changes.append(PetChange(CHANGED, pet.id, pet, fields))
+    for pet_id, old in previous.items():
+        if pet_id not in seen:
+            changes.append(PetChange(REMOVED, pet_id, None, {}))
+    return changes
+
+
+class PendingVersion(NamedTuple):
+    """
+    트랜잭션이 커밋되면 ChangeLog에 반영할 상태
+    """
+    shop_id: str
+    version: int
+    pruned_through: int
+
+
+class ChangeLog:
+    """
+    버전과 변경 이력 (PetStore의 연결과 트랜잭션 안에서 사용)
+    """
+
+    def __init__(self, retain: int = RETAIN_VERSIONS):
+        self.retain = retain
+        # 마지막 버전
+        self.version = 0
+        # 이 버전까지의 변경은 삭제됨 (since가 이보다 작으면 전체를 다시 받아야 함)
+        self.pruned_through = 0
+        # 샵별 마지막 변경 버전
+        self.shop_versions: Dict[str, int] = {}
+
+    def load(self, conn: sqlite3.Connection):
+        meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        self.version = int(meta.get("version", 0))
+        self.pruned_through = int(meta.get("pruned_through", 0))
+        self.shop_versions = {
+            key[len("shop_version:"):]: int(value)
+            for key, value in meta.items()
+            if key.startswith("shop_version:")
+        }
+
+    def record(self, conn: sqlite3.Connection, shop_id: str,
+               previous: Dict[str, Pet], pets: List[Pet]) -> Optional[PendingVersion]:
+        """
+        샵의 새 결과를 이전 목록과 비교하여 기록 (변경이 있을 때만 버전 증가)
+        메모리 상태는 바꾸지 않음 - 호출 측이 트랜잭션을 커밋한 뒤 반환값을 apply에 넘김
+        반환: 반영할 상태 (변경이 없으면 None)
+        """
+        changes = diff_pets(previous, pets)
+        if not changes:
+            return None
+
+        version = self.version + 1
+        now = datetime.now().isoformat()
+        conn.executemany(
+            "INSERT INTO pet_changes (version, shop_id, pet_id, kind, pet, fields, changed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    version, shop_id, change.pet_id, change.kind,
+                    orjson.dumps(change.pet.model_dump()).decode("utf-8") if change.pet is not None else None,
+                    orjson.dumps(change.fields).decode("utf-8") if change.fields else None,
+                    now,
+                )
+                for change in changes
+            ],
+        )
+        meta = [("version", str(version)), (f"shop_version:{shop_id}", str(version))]
+        pruned_through = self.pruned_through
+        if version - self.retain > pruned_through:
+            pruned_through = version - self.retain
+            conn.execute("DELETE FROM pet_changes WHERE version <= ?", (pruned_through,))
+            meta.append(("pruned_through", str(pruned_through)))
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            meta,
+        )
+        return PendingVersion(shop_id, version, pruned_through)
+
+    def apply(self, pending: Optional[PendingVersion]):
+        """
+        커밋된 record 결과를 메모리 상태에 반영
+        """
+        if pending is None:
+            return
+        self.version = pending.version
+        self.pruned_through = pending.pruned_through
+        self.shop_versions[pending.shop_id] = pending.version
+
+    def since(self, conn: sqlite3.Connection, since: int, shop_id: Optional[str] = None) -> dict:
+        """
+        since 버전 이후의 변경을 샵별로 합쳐서 반환
+        {"version", "since", "reset", "shops": {shop_id: {"added": [Pet], "changed": [...], "removed": [id]}}}
+        """
+        sql = "SELECT shop_id, pet_id, kind, pet, fields FROM pet_changes WHERE version > ?"
+        params: list = [since]
+        if shop_id is not None:
+            sql += " AND shop_id = ?"
+            params.append(shop_id)
+        sql += " ORDER BY version, rowid"
+        rows = conn.execute(sql, params).fetchall()
+
+        # (샵, Pet ID) -> [종류, Pet JSON, 필드별 (이전 값, 새 값)]
+        merged: Dict[Tuple[str, str], list] = {}
+        for row_shop, pet_id, kind, pet, fields in rows:
+            key = (row_shop, pet_id)
+            entry = merged.get(key)
+            if kind == REMOVED:
+                if entry is not None and entry[0] == ADDED:
+                    # since 이후에 추가되었다가 삭제됨 -> 클라이언트는 몰라도 됨
+                    del merged[key]
+                else:
+                    merged[key] = [REMOVED, None, {}]
+            elif kind == ADDED or entry is None or entry[0] == REMOVED:
+                merged[key] = [kind if entry is None else ADDED, pet, orjson.loads(fields) if fields else {}]
+            else:
+                # 추가/변경 이후의 변경: 최신 Pet, 필드는 처음 이전 값과 마지막 새 값
+                entry[1] = pet
+                for name, (old, new) in orjson.loads(fields).items():
+                    entry[2][name] = (entry[2][name][0] if name in entry[2] else old, new)
+
+        shops: Dict[str, dict] = {}
+        for (row_shop, pet_id), (kind, pet, fields) in merged.items():
+            shop = shops.setdefault(row_shop, {"added": [], "changed": [], "removed": []})
+            if kind == ADDED:
+                shop["added"].append(orjson.loads(pet))
+            elif kind == REMOVED:
+                shop["removed"].append(pet_id)
+            else:
+                changed = {name: {"old": old, "new": new} for name, (old, new) in fields.items() if old != new}
+                if changed:
+                    shop["changed"].append({"id": pet_id, "fields": changed, "pet": orjson.loads(pet)})
+        return {
+            "version": self.version,
+            "since": since,
+            "reset": since < self.pruned_through,
+            "shops": shops,
+        }
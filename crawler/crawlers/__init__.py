@@ -1,6 +1,8 @@
 """
 크롤러 모듈 초기화
+각 크롤러 모듈은 처음 사용할 때 import (registry.CrawlerRegistry 참고)
 """
+import importlib
 import sys
 from pathlib import Path
 
@@ -10,26 +12,32 @@ parent_dir = current_dir.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
-from .zooseyo import crawl_zooseyo
-from .yourpet import crawl_yourpet
-from .meyoupet import crawl_meyoupet
-from .meyoupet_gwangju import crawl_meyoupet_gwangju
-from .petworldkorea import crawl_petworldkorea
-from .petami import crawl_petami
-from .adamspet import crawl_adamspet
-from .petkas import crawl_petkas
-from .petfree import crawl_petfree
-from .dorothypet import crawl_dorothypet
+# 기본 크롤러 메타데이터: (샵 ID, "모듈:함수", BASE_URL)
+# 새 크롤러는 여기에 한 줄 추가하거나 엔트리 포인트로 등록
+BUILTIN_CRAWLERS = (
+    ("zooseyo", "crawlers.zooseyo:crawl_zooseyo", "https://www.zooseyo.com"),
+    ("yourpet", "crawlers.yourpet:crawl_yourpet", "https://yourpetkr.com"),
+    ("meyoupet", "crawlers.meyoupet:crawl_meyoupet", "https://meyoupet.co.kr"),
+    ("meyoupet-gwangju", "crawlers.meyoupet_gwangju:crawl_meyoupet_gwangju", "https://meyoupet-gwangju.co.kr"),
+    ("petworldkorea", "crawlers.petworldkorea:crawl_petworldkorea", "https://m.petworldkorea.com"),
+    ("petami", "crawlers.petami:crawl_petami", "https://petami.co.kr"),
+    ("adamspet", "crawlers.adamspet:crawl_adamspet", "https://www.adamspet.co.kr"),
+    ("petkas", "crawlers.petkas:crawl_petkas", "https://www.petkas.co.kr"),
+    ("petfree", "crawlers.petfree:crawl_petfree", "https://jpet.jboard.net"),
+    ("dorothypet", "crawlers.dorothypet:crawl_dorothypet", "https://dorothypet.co.kr"),
+)
 
-__all__ = [
-    "crawl_zooseyo",
-    "crawl_yourpet",
-    "crawl_meyoupet",
-    "crawl_meyoupet_gwangju",
-    "crawl_petworldkorea",
-    "crawl_petami",
-    "crawl_adamspet",
-    "crawl_petkas",
-    "crawl_petfree",
-    "crawl_dorothypet",
-]
+# 크롤링 함수 이름 -> 모듈 (from crawlers import crawl_x 호환용)
+_LAZY_FUNCTIONS = {
+    target.partition(":")[2]: target.partition(":")[0]
+    for _, target, _ in BUILTIN_CRAWLERS
+}
+
+__all__ = ["BUILTIN_CRAWLERS", *_LAZY_FUNCTIONS]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_FUNCTIONS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -2,106 +2,37 @@
 도로시펫 (dorothypet.co.kr) 크롤러
 난이도: 중 (Lazy Loading - data-original 속성)
 """
-import sys
-from pathlib import Path
-
-# 상위 디렉토리를 path에 추가
-current_dir = Path(__file__).parent
-parent_dir = current_dir.parent
-sys.path.insert(0, str(parent_dir))
-
-import requests
-from bs4 import BeautifulSoup
 from typing import List
 from models import Pet
-from utils import (
-    make_absolute_url,
-    extract_price,
-    extract_age,
-    extract_gender,
-    clean_text,
-    get_image_url,
-    get_default_headers,
-    sleep_random,
-)
+from engine import ShopSpec, Attr, Image, Text, crawl_spec
 
 BASE_URL = "https://dorothypet.co.kr"
 SHOP_ID = "dorothypet"
 SHOP_NAME = "도로시펫"
 
+# 같은 호스트에 대한 요청 사이의 최소 간격 (초)
+REQUEST_INTERVAL = 0.5
+
+SPEC = ShopSpec(
+    shop_id=SHOP_ID,
+    shop_name=SHOP_NAME,
+    base_url=BASE_URL,
+    # 목록 컨테이너: ul.prdList > li.xans-record- (아담스펫과 같은 Cafe24 구조)
+    containers=("ul.prdList",),
+    items="li.xans-record-, li[class*='xans']",
+    # 상세 페이지 링크: div.thumbnail > a 태그의 href
+    link=Attr("div.thumbnail a, .thumbnail a", "href"),
+    # 이미지 URL: div.thumbnail > a > img 태그의 data-original 속성 (Lazy Loading)
+    image=Image("div.thumbnail img, .thumbnail img", lazy_attrs=("data-original", "data-src", "data-lazy")),
+    # 이름: p.name (품종은 이름의 첫 단어)
+    name=Text("p.name, .name"),
+    price=Text(".price, [class*='price']"),
+    request_interval=REQUEST_INTERVAL,
+)
+
 
-def crawl_dorothypet() -> List[Pet]:
+async def crawl_dorothypet() -> List[Pet]:
     """
     도로시펫 사이트 크롤링
     """
-    pets = []
-    url = f"{BASE_URL}/"
-    
-    try:
-        response = requests.get(url, headers=get_default_headers(), timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
-        
-        # 목록 컨테이너: ul.prdList
-        list_container = soup.select_one("ul.prdList")
-        if not list_container:
-            return pets
-        
-        # 개별 아이템: li.xans-record-
-        items = list_container.select("li.xans-record-, li[class*='xans']")
-        
-        for i, item in enumerate(items):
-            try:
-                # 상세 페이지 링크: div.thumbnail > a 태그의 href
-                link_elem = item.select_one("div.thumbnail a, .thumbnail a")
-                if not link_elem:
-                    continue
-                
-                detail_url = make_absolute_url(link_elem.get("href", ""), BASE_URL)
-                
-                # 이미지 URL: div.thumbnail > a > img 태그의 data-original 속성 (Lazy Loading)
-                img_elem = item.select_one("div.thumbnail img, .thumbnail img")
-                image_url = ""
-                if img_elem:
-                    # data-original 우선 확인
-                    image_url = get_image_url(img_elem, BASE_URL, lazy_attrs=["data-original", "data-src", "data-lazy"])
-                
-                # 이름: p.name
-                name_elem = item.select_one("p.name, .name")
-                name = clean_text(name_elem.get_text()) if name_elem else f"이름 없음 {i+1}"
-                
-                # 가격 정보 추출 시도
-                price_elem = item.select_one(".price, [class*='price']")
-                price = extract_price(price_elem.get_text()) if price_elem else 0
-                
-                # 품종 추출 시도
-                breed = name.split()[0] if " " in name else "품종 미상"
-                
-                pet = Pet(
-                    id=f"{SHOP_ID}-{i}",
-                    name=name,
-                    breed=breed,
-                    age="나이 미상",
-                    gender="수컷",
-                    price=price,
-                    location="지역 미상",
-                    image=image_url or "/placeholder.jpg",
-                    shop=SHOP_NAME,
-                    shopUrl=BASE_URL,
-                    shopId=SHOP_ID,
-                    type="dog",
-                    description=clean_text(item.get_text()),
-                    crawledAt=__import__("datetime").datetime.now().isoformat(),
-                )
-                
-                pets.append(pet)
-                sleep_random(0.2, 0.5)
-                
-            except Exception as e:
-                print(f"도로시펫 아이템 {i} 처리 중 오류: {e}")
-                continue
-        
-    except Exception as e:
-        print(f"도로시펫 크롤링 오류: {e}")
-    
-    return pets
+    return await crawl_spec(SPEC)
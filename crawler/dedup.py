@@ -0,0 +1,235 @@
+"""
+샵 간 중복 목록 찾기 (MinHash + LSH)
+같은 동물이 여러 샵(예: meyoupet / meyoupet-gwangju)에 올라온 경우를 하나의 대표 Pet과 대체(alternates) 목록으로 묶음
+- 지문: 품종, 설명 글자 3-gram, 가격대, 이미지 파일 이름을 토큰 집합으로 만들고 MinHash 서명 계산
+- 후보: 서명을 밴드로 나눠 같은 버킷에 들어간 Pet끼리만 비교 (전체 쌍을 비교하지 않음)
+- 확인: 다른 샵이고 품종이 같으며 토큰 집합의 자카드 유사도가 임계값 이상이면 같은 동물로 보고 union-find로 묶음
+"""
+import hashlib
+import os
+import random
+import re
+import zlib
+from collections import OrderedDict, defaultdict
+from posixpath import basename
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from models import CrawlResult, Pet, PetAlternate
+from normalize import clean_text
+
+# 같은 동물로 볼 최소 자카드 유사도
+DEDUP_THRESHOLD = float(os.getenv("CRAWLER_DEDUP_THRESHOLD", "0.7"))
+
+# MinHash 서명 길이 = BANDS * ROWS (밴드 하나가 모두 같을 확률이 s^ROWS이므로 후보 기준은 약 (1/BANDS)^(1/ROWS))
+BANDS = 12
+ROWS = 5
+NUM_PERM = BANDS * ROWS
+
+# 이보다 큰 버킷은 구분력이 없는 것으로 보고 건너뜀 (같은 품종/가격의 설명 없는 목록 등)
+MAX_BUCKET = 64
+
+# 설명은 앞부분만 사용
+MAX_DESCRIPTION = 300
+
+# 가격대 (원)
+PRICE_BUCKET = 10000
+
+# 지문으로 쓰지 않는 이미지 (기본 이미지 등)
+GENERIC_IMAGE_RE = re.compile(r"no[_-]?im(a)?g|noimage|placeholder|blank|default", re.IGNORECASE)
+
+# MinHash 해시 함수 ((a * x + b) mod P, 실행할 때마다 같은 서명이 나오도록 고정 시드)
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240113)
+PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+)
+
+# 토큰 -> 해시 함수별 값 (설명 3-gram은 목록 사이에 많이 겹치므로 토큰 단위로 재사용)
+MAX_TOKENS = 200000
+_token_hashes: Dict[str, Tuple[int, ...]] = {}
+
+# 토큰 집합 -> 서명 캐시 (다시 크롤링해도 대부분의 목록은 그대로이므로 서명을 재사용)
+MAX_SIGNATURES = 50000
+_signatures: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+
+
+def normalize_breed(breed: str) -> str:
+    return clean_text(breed).replace(" ", "").lower()
+
+
+def image_token(url: str) -> str:
+    """
+    이미지 URL의 파일 이름 (샵마다 호스트가 달라도 같은 원본이면 같은 값, 기본 이미지면 빈 문자열)
+    """
+    if not url:
+        return ""
+    name = basename(urlparse(url).path).lower()
+    if not name or GENERIC_IMAGE_RE.search(name):
+        return ""
+    return name
+
+
+def fingerprint(pet: Pet) -> Optional[FrozenSet[str]]:
+    """
+    Pet의 지문 토큰 집합 (설명도 이미지도 없으면 구분할 수 없으므로 None)
+    """
+    description = clean_text(pet.description)[:MAX_DESCRIPTION].lower()
+    image = image_token(pet.image)
+    if not description and not image:
+        return None
+    tokens = set()
+    breed = normalize_breed(pet.breed)
+    if breed:
+        tokens.add(f"b:{breed}")
+    if pet.price > 0:
+        tokens.add(f"p:{pet.price // PRICE_BUCKET}")
+    if image:
+        tokens.add(f"i:{image}")
+    if len(description) < 3:
+        if description:
+            tokens.add(f"d:{description}")
+    else:
+        tokens.update(f"d:{description[i:i + 3]}" for i in range(len(description) - 2))
+    return frozenset(tokens)
+
+
+def minhash(tokens: FrozenSet[str]) -> Tuple[int, ...]:
+    """
+    토큰 집합의 MinHash 서명 (같은 집합이면 캐시된 서명 사용)
+    """
+    key = hashlib.sha1("\x1f".join(sorted(tokens)).encode("utf-8")).hexdigest()
+    signature = _signatures.get(key)
+    if signature is not None:
+        _signatures.move_to_end(key)
+        return signature
+    signature = tuple(map(min, zip(*map(token_hashes, tokens))))
+    _signatures[key] = signature
+    if len(_signatures) > MAX_SIGNATURES:
+        _signatures.popitem(last=False)
+    return signature
+
+
+def token_hashes(token: str) -> Tuple[int, ...]:
+    """
+    토큰의 해시 함수별 값 (서명은 토큰 값들의 위치별 최솟값)
+    """
+    values = _token_hashes.get(token)
+    if values is None:
+        if len(_token_hashes) >= MAX_TOKENS:
+            _token_hashes.clear()
+        x = zlib.crc32(token.encode("utf-8"))
+        values = _token_hashes[token] = tuple((a * x + b) % _PRIME for a, b in PERMUTATIONS)
+    return values
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # 먼저 나온 Pet이 루트가 되도록
+            if root_j < root_i:
+                root_i, root_j = root_j, root_i
+            self.parent[root_j] = root_i
+
+
+def find_duplicates(pets: Sequence[Pet], threshold: float = DEDUP_THRESHOLD) -> List[List[int]]:
+    """
+    중복으로 보이는 Pet 묶음 (pets의 인덱스 목록, 두 개 이상인 묶음만)
+    """
+    fingerprints = [fingerprint(pet) for pet in pets]
+    breeds = [normalize_breed(pet.breed) for pet in pets]
+
+    # 밴드별 버킷 (품종이 다르면 같은 동물로 보지 않으므로 버킷 키에 품종 포함)
+    buckets: Dict[Tuple[int, str, Tuple[int, ...]], List[int]] = defaultdict(list)
+    for i, tokens in enumerate(fingerprints):
+        if tokens is None:
+            continue
+        signature = minhash(tokens)
+        for band in range(BANDS):
+            buckets[(band, breeds[i], signature[band * ROWS:(band + 1) * ROWS])].append(i)
+
+    uf = UnionFind(len(pets))
+    checked = set()
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > MAX_BUCKET:
+            continue
+        for x, i in enumerate(members):
+            for j in members[x + 1:]:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if pets[i].shopId == pets[j].shopId:
+                    continue
+                if jaccard(fingerprints[i], fingerprints[j]) >= threshold:
+                    uf.union(i, j)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in range(len(pets)):
+        groups[uf.find(i)].append(i)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def canonical_rank(pet: Pet) -> tuple:
+    """
+    대표 Pet 선택 기준 (정보가 많은 목록 우선)
+    """
+    return (bool(pet.description), pet.price > 0, bool(pet.image), len(pet.description))
+
+
+def to_alternate(pet: Pet) -> PetAlternate:
+    return PetAlternate(
+        id=pet.id,
+        shop=pet.shop,
+        shopId=pet.shopId,
+        shopUrl=pet.shopUrl,
+        price=pet.price,
+        detailUrl=pet.detailUrl,
+    )
+
+
+def dedupe_results(results: List[CrawlResult],
+                   threshold: float = DEDUP_THRESHOLD) -> Tuple[List[CrawlResult], int]:
+    """
+    샵별 결과에서 중복 Pet을 대표 하나로 묶음
+    대표 Pet은 자기 샵 결과에 alternates와 함께 남고, 나머지는 각 샵 결과에서 빠짐
+    반환: (새 결과 목록, 빠진 Pet 수)
+    """
+    pets = [pet for result in results for pet in result.pets]
+    groups = find_duplicates(pets, threshold)
+    if not groups:
+        return results, 0
+
+    replaced: Dict[str, Pet] = {}
+    removed = set()
+    for group in groups:
+        # 순위가 같으면 먼저 나온 Pet (max는 처음 만난 최댓값을 반환)
+        best = max(group, key=lambda i: canonical_rank(pets[i]))
+        alternates = [to_alternate(pets[i]) for i in group if i != best]
+        replaced[pets[best].id] = pets[best].model_copy(update={"alternates": alternates})
+        removed.update(pets[i].id for i in group if i != best)
+
+    deduped = []
+    for result in results:
+        kept = [replaced.get(pet.id, pet) for pet in result.pets if pet.id not in removed]
+        if len(kept) == len(result.pets) and not any(pet.id in replaced for pet in result.pets):
+            deduped.append(result)
+        else:
+            deduped.append(result.model_copy(update={"pets": kept, "count": len(kept)}))
+    return deduped, len(removed)
@@ -0,0 +1,534 @@
+"""
+선택자 명세(spec) 기반 크롤러 엔진
+샵별 모듈은 ShopSpec만 정의하고, 목록 파싱은 이 모듈의 공통 루프에서 처리
+선택자는 모듈 로드 시 한 번만 컴파일하여 매 크롤링마다 재사용
+파싱 결과는 간결한 레코드(튜플)로 만들고 Pet은 마지막에 한 번 생성
+(CRAWLER_PARSE_WORKERS > 0이면 레코드까지는 파싱 프로세스에서 만듦, parse_pool.py)
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+
+import metrics
+import parse_pool
+import progress
+from models import Pet
+from fetcher import DEFAULT_TIMEOUT, MAX_CACHED_PAGES, fetch_page, set_request_interval
+from enrich import ENRICH_ENABLED, DetailSpec, enrich_pets
+from images import thumbnail_url
+from normalize import normalize_records
+from utils import (
+    extract_background_image_url,
+    extract_onclick_url,
+    make_absolute_url,
+    make_pet_id,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAZY_ATTRS = ("data-src", "data-original", "data-lazy", "data-url")
+
+# 샵별 최대 목록 페이지 수 (ShopSpec.max_pages로 샵마다 재정의 가능)
+DEFAULT_MAX_PAGES = int(os.getenv("CRAWLER_MAX_PAGES", "3"))
+
+# 페이지네이션 요소의 class (범용 선택자와 fast 모드 strainer가 함께 사용, 부분 문자열이 아니라 정확히 일치)
+PAGER_CLASSES = ("pagination", "paging", "paginate", "pg_wrap", "xans-product-normalpaging")
+
+# 페이지 링크를 찾을 때 사용하는 범용 페이지네이션 선택자
+DEFAULT_PAGER = ", ".join(f".{name} a" for name in PAGER_CLASSES)
+
+# 페이지 번호로 보는 쿼리 파라미터 (페이지 링크는 목록 URL과 이 값만 달라야 함)
+PAGE_PARAMS = frozenset(("page", "p", "pg", "cpage", "pageno", "page_no"))
+
+# 파싱 모드
+# - fast: 목록 컨테이너(와 페이지네이션)만 트리로 만듦 (SoupStrainer)
+# - full: 페이지 전체를 트리로 만듦
+PARSE_MODE = os.getenv("CRAWLER_PARSE_MODE", "fast")
+
+# "tag.class#id" 형태의 단순 선택자 (fast 모드 strainer로 변환 가능한 형태)
+SIMPLE_SELECTOR_RE = re.compile(r"^([a-zA-Z][\w-]*)?((?:[.#][\w-]+)+)$")
+
+# 파싱 레코드 필드 순서 (프로세스 사이에 주고받는 튜플)
+RECORD_FIELDS = (
+    "id", "name", "breed", "age", "gender", "price", "location",
+    "image", "type", "description", "detail_url",
+)
+
+# URL별 마지막 파싱 결과 (본문 해시, Pet 리스트, 페이지 링크) - 본문이 같으면 다시 파싱하지 않음
+# fetcher의 페이지 캐시와 같은 수(MAX_CACHED_PAGES)까지만 최근 사용 순으로 유지
+_parsed_pages: "OrderedDict[str, Tuple[str, List[Pet], List[str]]]" = OrderedDict()
+
+
+def listing_params(query: str) -> set:
+    """
+    페이지 번호를 뺀 쿼리 파라미터
+    """
+    return {(name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+            if name.lower() not in PAGE_PARAMS}
+
+
+def build_strainer(selectors: Sequence[str], keep_pager: bool) -> Optional[SoupStrainer]:
+    """
+    컨테이너 선택자들의 첫 단순 선택자(조합자 앞부분)로 SoupStrainer 생성
+    "ul.list-gallery", "#zboard_list > ul", "ul#gallery_list_body" 등을 지원하며
+    속성 선택자처럼 변환할 수 없는 부분은 건너뜀 (변환 가능한 부분이 없으면 None)
+    """
+    matchers = []
+    for selector in selectors:
+        for part in selector.split(","):
+            words = part.split()
+            match = SIMPLE_SELECTOR_RE.match(words[0]) if words else None
+            if not match:
+                continue
+            compound = re.findall(r"[.#][\w-]+", match.group(2))
+            classes = {name[1:] for name in compound if name[0] == "."}
+            ids = {name[1:] for name in compound if name[0] == "#"}
+            matchers.append((match.group(1), classes, ids))
+    if not matchers:
+        return None
+
+    def keep(name, attrs) -> bool:
+        class_attr = attrs.get("class") or ""
+        class_names = set(class_attr.split() if isinstance(class_attr, str) else class_attr)
+        if keep_pager and not class_names.isdisjoint(PAGER_CLASSES):
+            return True
+        for tag_name, classes, ids in matchers:
+            if tag_name and name != tag_name:
+                continue
+            if ids and attrs.get("id") not in ids:
+                continue
+            if classes <= class_names:
+                return True
+        return False
+
+    return SoupStrainer(keep)
+
+
+class Extractor:
+    """
+    아이템 요소에서 값 하나를 추출하는 기본 클래스
+    selector가 없으면 아이템 요소 자체를 대상으로 함
+    대상 요소가 없으면 None, 있으면 문자열을 반환
+    """
+
+    def __init__(self, selector: Optional[str] = None):
+        self.selector = selector
+        self._compiled = sv.compile(selector) if selector else None
+
+    def __call__(self, item) -> Optional[str]:
+        elem = self._compiled.select_one(item) if self._compiled else item
+        if elem is None:
+            return None
+        return self.extract(elem)
+
+    def extract(self, elem) -> str:
+        raise NotImplementedError
+
+
+class Text(Extractor):
+    """
+    요소의 텍스트 (공백 정리는 normalize_records에서 목록 단위로 처리)
+    """
+
+    def extract(self, elem) -> str:
+        return elem.get_text()
+
+
+class Attr(Extractor):
+    """
+    요소의 속성 값
+    """
+
+    def __init__(self, selector: Optional[str], attr: str):
+        super().__init__(selector)
+        self.attr = attr
+
+    def extract(self, elem) -> str:
+        return elem.get(self.attr, "")
+
+
+class Image(Extractor):
+    """
+    img 요소의 이미지 URL (lazy loading 속성 우선, 없으면 src)
+    """
+
+    def __init__(self, selector: Optional[str], lazy_attrs: Sequence[str] = DEFAULT_LAZY_ATTRS):
+        super().__init__(selector)
+        self.lazy_attrs = tuple(lazy_attrs)
+
+    def extract(self, elem) -> str:
+        for attr in self.lazy_attrs:
+            url = elem.get(attr)
+            if url:
+                return url
+        return elem.get("src", "")
+
+
+class Background(Extractor):
+    """
+    style 속성의 background(-image) URL
+    """
+
+    def extract(self, elem) -> str:
+        return extract_background_image_url(elem.get("style", ""))
+
+
+class Onclick(Extractor):
+    """
+    onclick 속성의 location.href / window.open URL
+    """
+
+    def extract(self, elem) -> str:
+        return extract_onclick_url(elem.get("onclick", ""))
+
+
+class FirstOf:
+    """
+    여러 추출기를 순서대로 시도하여 처음으로 비어 있지 않은 값을 반환
+    """
+
+    def __init__(self, *extractors: Extractor):
+        self.extractors = extractors
+
+    def __call__(self, item) -> Optional[str]:
+        result = None
+        for extractor in self.extractors:
+            value = extractor(item)
+            if value:
+                return value
+            if value is not None:
+                result = value
+        return result
+
+
+@dataclass
+class ShopSpec:
+    """
+    샵별 크롤링 명세
+    - containers: 목록 컨테이너 선택자 (앞에서부터 시도하는 대체 선택자 목록)
+    - items: 컨테이너 안의 개별 아이템 선택자
+    - link/image/name/breed/price/description: 필드 추출기
+      (breed가 None이면 이름의 첫 단어를 품종으로 사용)
+    - require_link: 링크 요소가 없는 아이템은 건너뜀
+    - post_process: 아이템 요소와 원시 레코드 dict를 받아 샵 고유 필드를 채우는 훅
+      (age/gender/location/type 등 원시 텍스트를 넣으면 정규화 단계에서 변환)
+    - empty_name: 이름이 비어 있을 때 사용할 템플릿 (예: "{breed} {number}")
+    - detail: 상세 페이지 추출기 (CRAWLER_ENRICH_DETAILS=1일 때 사용, None이면 보강하지 않음)
+    - page_url: 2페이지부터의 목록 URL 템플릿 (예: "/board.php?page={page}")
+      없으면 첫 페이지의 pager 선택자로 페이지 링크를 찾음
+    - max_pages: 최대 목록 페이지 수 (None이면 CRAWLER_MAX_PAGES)
+    """
+    shop_id: str
+    shop_name: str
+    base_url: str
+    containers: Tuple[str, ...]
+    items: str
+    path: str = "/"
+    link: Optional[Callable] = None
+    image: Optional[Callable] = None
+    name: Optional[Callable] = None
+    breed: Optional[Callable] = None
+    price: Optional[Callable] = None
+    description: Callable = field(default_factory=Text)
+    require_link: bool = True
+    empty_name: Optional[str] = None
+    default_age: str = "나이 미상"
+    default_gender: str = "수컷"
+    default_location: str = "지역 미상"
+    default_type: str = "dog"
+    post_process: Optional[Callable] = None
+    detail: Optional[DetailSpec] = field(default_factory=DetailSpec)
+    page_url: Optional[str] = None
+    pager: Optional[str] = DEFAULT_PAGER
+    max_pages: Optional[int] = None
+    request_interval: float = 0.5
+    timeout: float = DEFAULT_TIMEOUT
+
+    def __post_init__(self):
+        # 선택자는 명세 생성(모듈 로드) 시 한 번만 컴파일
+        self._containers = [sv.compile(selector) for selector in self.containers]
+        self._items = sv.compile(self.items)
+        self._pager = sv.compile(self.pager) if self.pager else None
+        # fast 모드: 컨테이너 후보와 (필요하면) 페이지네이션만 트리로 만듦
+        self._strainer = build_strainer(
+            self.containers, keep_pager=self._pager is not None and not self.page_url
+        )
+        set_request_interval(self.base_url, self.request_interval)
+
+    @property
+    def url(self) -> str:
+        return make_absolute_url(self.path, self.base_url)
+
+    @property
+    def page_limit(self) -> int:
+        return self.max_pages if self.max_pages is not None else DEFAULT_MAX_PAGES
+
+    def generated_page_urls(self) -> List[str]:
+        """
+        page_url 템플릿으로 만든 2페이지 이후 URL
+        """
+        if not self.page_url:
+            return []
+        return [
+            make_absolute_url(self.page_url.format(page=page), self.base_url)
+            for page in range(2, self.page_limit + 1)
+        ]
+
+    def discover_page_urls(self, soup, page_url: str) -> List[str]:
+        """
+        페이지네이션 링크에서 다른 목록 페이지 URL 수집 (문서 순서 유지)
+        목록 URL과 호스트/경로가 같고 쿼리는 페이지 번호(PAGE_PARAMS)만 다른 링크만 사용
+        """
+        if self._pager is None:
+            return []
+        listing = urlparse(self.url)
+        listing_query = listing_params(listing.query)
+        urls = []
+        for link in self._pager.select(soup):
+            href = (link.get("href") or "").strip()
+            if not href or href.startswith(("#", "javascript:")):
+                continue
+            url = make_absolute_url(href, page_url)
+            parsed = urlparse(url)
+            if (parsed.netloc != listing.netloc or parsed.path != listing.path
+                    or listing_params(parsed.query) != listing_query):
+                continue
+            if url == page_url or url in urls:
+                continue
+            urls.append(url)
+        return urls
+
+    def find_container(self, soup):
+        for compiled in self._containers:
+            container = compiled.select_one(soup)
+            if container is not None:
+                return container
+        return None
+
+
+def parse_item(spec: ShopSpec, item, index: int) -> Optional[dict]:
+    """
+    아이템 요소 하나를 원시 레코드 dict로 변환 (링크가 필수인데 없으면 None)
+    값은 추출기가 반환한 그대로이며, 정리/변환은 normalize_records에서 목록 단위로 처리
+    """
+    link = spec.link(item) if spec.link else None
+    if link is None and spec.require_link:
+        return None
+
+    record = {
+        "index": index,
+        "link": link,
+        "image": spec.image(item) if spec.image else None,
+        "name": spec.name(item) if spec.name else None,
+        "breed": spec.breed(item) if spec.breed else None,
+        "price": spec.price(item) if spec.price else None,
+        "description": spec.description(item) if spec.description else None,
+    }
+    if spec.post_process:
+        spec.post_process(item, record)
+    return record
+
+
+def make_soup(spec: ShopSpec, html: str, mode: Optional[str] = None):
+    """
+    파싱 모드에 따라 트리 생성
+    fast 모드에서 컨테이너를 찾지 못하면(대체 선택자가 필요한 경우 등) 전체 파싱으로 재시도
+    """
+    if (mode or PARSE_MODE) == "fast" and spec._strainer is not None:
+        soup = BeautifulSoup(html, "lxml", parse_only=spec._strainer)
+        if spec.find_container(soup) is not None:
+            return soup
+    return BeautifulSoup(html, "lxml")
+
+
+def parse_page(spec: ShopSpec, html: str, page_url: str,
+               mode: Optional[str] = None) -> Tuple[List[Pet], List[str]]:
+    """
+    목록 페이지 HTML을 (Pet 리스트, 페이지네이션 링크)로 변환
+    """
+    records, page_urls, failures = parse_page_records(spec, html, page_url, mode)
+    if failures:
+        metrics.item_failures.inc(spec.shop_id, amount=failures)
+    return build_pets(spec, records), page_urls
+
+
+def parse_page_records(spec: ShopSpec, html: str, page_url: str,
+                       mode: Optional[str] = None) -> Tuple[List[tuple], List[str], int]:
+    """
+    목록 페이지 HTML을 (레코드 리스트, 페이지네이션 링크, 실패한 아이템 수)로 변환
+    메트릭을 직접 기록하지 않으므로 파싱 프로세스에서도 그대로 사용
+    """
+    soup = make_soup(spec, html, mode)
+    records, failures = parse_records(spec, soup)
+    page_urls = spec.discover_page_urls(soup, page_url) if not spec.page_url else []
+    return records, page_urls, failures
+
+
+def parse_records(spec: ShopSpec, soup) -> Tuple[List[tuple], int]:
+    """
+    목록 컨테이너의 아이템을 정규화된 레코드(RECORD_FIELDS 순서의 튜플)로 변환 (모든 샵이 공유하는 파싱 루프)
+    반환: (레코드 리스트, 실패한 아이템 수)
+    """
+    container = spec.find_container(soup)
+    if container is None:
+        return [], 0
+
+    # 1. 아이템별 원시 값 추출
+    raw_records = []
+    failures = 0
+    for i, item in enumerate(spec._items.select(container)):
+        try:
+            record = parse_item(spec, item, i)
+        except Exception as e:
+            logger.warning("%s 아이템 %d 처리 중 오류: %s", spec.shop_name, i, e)
+            failures += 1
+            continue
+        if record is not None:
+            raw_records.append(record)
+
+    # 2. 목록 단위 정규화 후 ID 부여
+    records = []
+    seen_ids = set()
+    for record in normalize_records(raw_records, spec):
+        pet_id = make_pet_id(
+            spec.shop_id,
+            record["detail_url"],
+            fallback=f"{record['image']}|{record['name']}|{record['description']}",
+        )
+        # 같은 목록이 한 페이지에 두 번 나오면 첫 번째만 사용
+        if pet_id in seen_ids:
+            continue
+        seen_ids.add(pet_id)
+        records.append((
+            pet_id, record["name"], record["breed"], record["age"], record["gender"],
+            record["price"], record["location"], record["image"], record["type"],
+            record["description"], record["detail_url"],
+        ))
+    return records, failures
+
+
+def build_pets(spec: ShopSpec, records: Sequence[tuple]) -> List[Pet]:
+    """
+    레코드를 Pet 리스트로 변환 (샵 정보, 크롤링 시각, 썸네일 주소 추가)
+    """
+    pets = []
+    crawled_at = datetime.now().isoformat()
+    for (pet_id, name, breed, age, gender, price, location,
+         image, pet_type, description, detail_url) in records:
+        try:
+            pets.append(
+                Pet(
+                    id=pet_id,
+                    name=name,
+                    breed=breed,
+                    age=age,
+                    gender=gender,
+                    price=price,
+                    location=location,
+                    image=image or "/placeholder.jpg",
+                    shop=spec.shop_name,
+                    shopUrl=spec.base_url,
+                    shopId=spec.shop_id,
+                    type=pet_type,
+                    description=description,
+                    crawledAt=crawled_at,
+                    detailUrl=detail_url,
+                    thumbnail=thumbnail_url(image),
+                )
+            )
+        except Exception as e:
+            logger.warning("%s 아이템 %s 처리 중 오류: %s", spec.shop_name, pet_id, e)
+            metrics.item_failures.inc(spec.shop_id)
+    return pets
+
+
+async def crawl_page(spec: ShopSpec, url: str) -> Tuple[List[Pet], List[str]]:
+    """
+    목록 페이지 하나를 가져와 파싱
+    본문 해시가 이전과 같으면(304 포함) 파싱을 건너뛰고 이전 결과를 사용
+    """
+    page = await fetch_page(url, timeout=spec.timeout)
+    previous = _parsed_pages.get(url)
+    if previous is not None and previous[0] == page.digest:
+        _parsed_pages.move_to_end(url)
+        return list(previous[1]), previous[2]
+    parsed = None
+    if parse_pool.enabled():
+        # 파싱 프로세스에 원본 바이트를 넘기고 레코드만 돌려받음 (이벤트 루프는 계속 I/O 처리)
+        parsed = await parse_pool.parse(spec.shop_id, page.content, page.encoding, url)
+    if parsed is None:
+        start = time.perf_counter()
+        records, page_urls, failures = parse_page_records(spec, page.text, url)
+        parsed = (records, page_urls, failures, time.perf_counter() - start)
+    records, page_urls, failures, seconds = parsed
+    metrics.parse_seconds.observe(spec.shop_id, value=seconds)
+    if failures:
+        metrics.item_failures.inc(spec.shop_id, amount=failures)
+    pets = build_pets(spec, records)
+    metrics.page_items.observe(spec.shop_id, value=len(pets))
+    _parsed_pages[url] = (page.digest, pets, page_urls)
+    _parsed_pages.move_to_end(url)
+    while len(_parsed_pages) > MAX_CACHED_PAGES:
+        _parsed_pages.popitem(last=False)
+    return list(pets), page_urls
+
+
+async def crawl_spec(spec: ShopSpec) -> List[Pet]:
+    """
+    명세에 따라 목록 페이지를 가져와 파싱
+    - 첫 페이지 이후 페이지는 page_url 템플릿 또는 페이지 링크로 정하고 동시에 요청
+    - 페이지 순서대로 합치다가 새 아이템이 없는 페이지에서 중단
+    - 추가 페이지 요청이 실패하면 크롤링 전체를 실패로 처리 (일부 페이지만 저장하면 나머지 목록이 삭제된 것으로 기록되므로)
+    - 페이지를 합칠 때마다 진행 상황에 기록하고, 마감 시간이 지났으면 CrawlCancelled로 중단
+    """
+    url = spec.url
+    progress.checkpoint()
+    try:
+        pets, discovered = await crawl_page(spec, url)
+    except Exception as e:
+        # 첫 페이지 요청 실패는 호출 측(run_crawler)에서 실패 결과로 처리
+        logger.warning("%s 크롤링 오류: %s", spec.shop_name, e)
+        raise
+    progress.publish(pets, pages=1)
+    progress.checkpoint()
+
+    extra_urls = (spec.generated_page_urls() or discovered)[:max(spec.page_limit - 1, 0)]
+    if extra_urls:
+        pages = await asyncio.gather(
+            *(crawl_page(spec, page_url) for page_url in extra_urls),
+            return_exceptions=True,
+        )
+        first_ids = {pet.id for pet in pets}
+        seen_ids = set(first_ids)
+        merged_pages = 1
+        for page_url, page in zip(extra_urls, pages):
+            if isinstance(page, Exception):
+                logger.warning("%s 페이지 요청 오류 (%s): %s", spec.shop_name, page_url, page)
+                raise page
+            new_pets = [pet for pet in page[0] if pet.id not in seen_ids]
+            if not new_pets:
+                # "1페이지" 링크처럼 첫 페이지와 같은 페이지는 건너뛰고, 그 외에는 중단
+                if {pet.id for pet in page[0]} == first_ids:
+                    continue
+                break
+            seen_ids.update(pet.id for pet in new_pets)
+            pets.extend(new_pets)
+            merged_pages += 1
+            progress.publish(pets, pages=merged_pages)
+        progress.checkpoint()
+
+    # 상세 페이지 보강 (상세 정보는 URL별 캐시를 거치므로 바뀌지 않은 목록은 다시 요청하지 않음)
+    if ENRICH_ENABLED and spec.detail is not None:
+        pets = await enrich_pets(spec.detail, pets, timeout=spec.timeout, shop_id=spec.shop_id)
+        progress.checkpoint()
+    return pets
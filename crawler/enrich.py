@@ -0,0 +1,207 @@
+"""
+상세 페이지 보강(enrichment) 단계
+목록에서 얻은 detailUrl의 상세 페이지를 제한된 동시성으로 가져와
+가격/나이/성별/종류/지역 등 목록에 없는 정보를 채움
+파싱한 상세 정보는 URL별로 TTL 동안 캐시하여 바뀌지 않은 목록은 다시 가져오지 않음
+상세 페이지 파싱은 이벤트 루프를 막지 않도록 파싱 프로세스 풀(CRAWLER_PARSE_WORKERS > 0) 또는 기본 스레드 풀에서 실행
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import soupsieve as sv
+from bs4 import BeautifulSoup
+
+import parse_pool
+from models import Pet
+from fetcher import fetch
+from progress import CrawlCancelled
+from utils import (
+    clean_text,
+    extract_age,
+    extract_gender,
+    extract_pet_type,
+    extract_price,
+)
+
+logger = logging.getLogger(__name__)
+
+# 보강 단계 설정
+ENRICH_ENABLED = os.getenv("CRAWLER_ENRICH_DETAILS", "0") == "1"
+DETAIL_CONCURRENCY = int(os.getenv("CRAWLER_DETAIL_CONCURRENCY", "4"))
+DETAIL_CACHE_TTL = float(os.getenv("CRAWLER_DETAIL_TTL", str(6 * 3600)))
+
+# 라벨 후보 요소 (표, 정의 목록, 강조 텍스트 등)
+LABEL_CELLS = "th, dt, td, li, span, strong, b, label, p"
+
+
+class Labeled:
+    """
+    "가격: 50만원"처럼 라벨 뒤에 오는 값을 추출
+    라벨과 값이 같은 요소에 있으면 라벨 뒤의 텍스트를, 아니면 다음 형제 요소의 텍스트를 반환
+    """
+
+    def __init__(self, *labels: str, cells: str = LABEL_CELLS):
+        self.labels = labels
+        self._cells = sv.compile(cells)
+
+    def __call__(self, root) -> Optional[str]:
+        for elem in self._cells.select(root):
+            text = clean_text(elem.get_text())
+            if not text or len(text) > 60:
+                continue
+            for label in self.labels:
+                if not text.startswith(label):
+                    continue
+                rest = text[len(label):].lstrip(" :：-|")
+                if rest:
+                    return rest
+                sibling = elem.find_next_sibling()
+                if sibling is not None:
+                    value = clean_text(sibling.get_text())
+                    if value:
+                        return value
+        return None
+
+
+@dataclass
+class DetailSpec:
+    """
+    샵별 상세 페이지 추출기 (각 필드는 soup을 받아 문자열 또는 None을 반환)
+    기본값은 한국 펫샵 상세 페이지에서 흔한 라벨을 찾는 범용 추출기
+    """
+    price: Optional[Callable] = field(default_factory=lambda: Labeled("분양가", "판매가", "가격"))
+    age: Optional[Callable] = field(default_factory=lambda: Labeled("나이", "생년월일", "출생일", "개월수"))
+    gender: Optional[Callable] = field(default_factory=lambda: Labeled("성별"))
+    type: Optional[Callable] = field(default_factory=lambda: Labeled("종류", "구분", "분류"))
+    breed: Optional[Callable] = field(default_factory=lambda: Labeled("품종", "견종", "묘종"))
+    location: Optional[Callable] = field(default_factory=lambda: Labeled("지역", "위치", "분양지역"))
+    vaccinated: Optional[Callable] = field(default_factory=lambda: Labeled("접종", "예방접종"))
+
+    def parse(self, html: str) -> Dict[str, object]:
+        """
+        상세 페이지 HTML에서 Pet 필드 값 추출 (찾은 필드만 포함)
+        """
+        soup = BeautifulSoup(html, "lxml")
+        fields: Dict[str, object] = {}
+
+        price_text = self.price(soup) if self.price else None
+        if price_text:
+            price = extract_price(price_text)
+            if price > 0:
+                fields["price"] = price
+
+        age_text = self.age(soup) if self.age else None
+        if age_text:
+            fields["age"] = extract_age(age_text)
+
+        gender_text = self.gender(soup) if self.gender else None
+        if gender_text:
+            fields["gender"] = extract_gender(gender_text)
+
+        type_text = self.type(soup) if self.type else None
+        pet_type = extract_pet_type(type_text or "")
+        if pet_type:
+            fields["type"] = pet_type
+
+        breed_text = self.breed(soup) if self.breed else None
+        if breed_text:
+            fields["breed"] = breed_text
+
+        location_text = self.location(soup) if self.location else None
+        if location_text:
+            fields["location"] = location_text
+
+        vaccinated_text = self.vaccinated(soup) if self.vaccinated else None
+        if vaccinated_text:
+            fields["vaccinated"] = "완료" in vaccinated_text and "미" not in vaccinated_text
+
+        return fields
+
+
+class DetailCache:
+    """
+    URL별 상세 정보 캐시 (TTL, 최대 항목 수 제한 LRU)
+    """
+
+    def __init__(self, ttl: float = DETAIL_CACHE_TTL, max_entries: int = 5000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[Dict[str, object]]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        stored_at, fields = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[url]
+            return None
+        self._entries.move_to_end(url)
+        return fields
+
+    def set(self, url: str, fields: Dict[str, object]):
+        self._entries[url] = (time.monotonic(), fields)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+detail_cache = DetailCache()
+
+
+def merge_detail(pet: Pet, fields: Dict[str, object]) -> Pet:
+    """
+    상세 정보를 Pet에 반영 (품종은 목록에서 알 수 없었던 경우에만 덮어씀)
+    """
+    update = dict(fields)
+    if "breed" in update and pet.breed != "품종 미상":
+        del update["breed"]
+    return pet.model_copy(update=update) if update else pet
+
+
+async def fetch_detail(detail: DetailSpec, url: str, semaphore: asyncio.Semaphore,
+                       timeout: float, shop_id: Optional[str] = None) -> Optional[Dict[str, object]]:
+    """
+    상세 페이지 하나를 가져와 파싱 (캐시 우선, 실패 시 None)
+    shop_id가 있고 파싱 프로세스 풀이 켜져 있으면 풀에서, 아니면 기본 스레드 풀에서 파싱
+    """
+    fields = detail_cache.get(url)
+    if fields is not None:
+        return fields
+    async with semaphore:
+        try:
+            response = await fetch(url, timeout=timeout)
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            logger.warning("상세 페이지 요청 오류 (%s): %s", url, e)
+            return None
+    fields = None
+    if shop_id is not None and parse_pool.enabled():
+        fields = await parse_pool.parse_detail(shop_id, response.content, response.encoding, url)
+    if fields is None:
+        loop = asyncio.get_running_loop()
+        fields = await loop.run_in_executor(None, detail.parse, response.text)
+    detail_cache.set(url, fields)
+    return fields
+
+
+async def enrich_pets(detail: DetailSpec, pets: List[Pet], concurrency: int = DETAIL_CONCURRENCY,
+                      timeout: float = 15.0, shop_id: Optional[str] = None) -> List[Pet]:
+    """
+    상세 페이지를 동시에(최대 concurrency개) 가져와 Pet 목록 보강
+    상세 URL이 없거나 요청에 실패한 Pet은 그대로 유지
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    targets = [pet for pet in pets if pet.detailUrl]
+    details = await asyncio.gather(
+        *(fetch_detail(detail, pet.detailUrl, semaphore, timeout, shop_id) for pet in targets)
+    )
+    by_url = {pet.detailUrl: fields for pet, fields in zip(targets, details) if fields}
+    return [merge_detail(pet, by_url[pet.detailUrl]) if pet.detailUrl in by_url else pet
+            for pet in pets]
@@ -0,0 +1,254 @@
+"""
+비동기 HTTP 요청 계층
+모든 크롤러가 하나의 장기 실행 클라이언트를 공유하여 호스트별 keep-alive 연결을 재사용
+호스트별 요청 간격 제한(예의 바른 크롤링)도 이 계층에서 처리
+URL별 ETag/Last-Modified를 기억하여 조건부 요청을 보내고, 본문 해시를 함께 제공
+"""
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+import metrics
+import progress
+from utils import get_default_headers
+
+DEFAULT_TIMEOUT = 15.0
+
+# 같은 호스트에 대한 요청 사이의 기본 최소 간격 (초)
+DEFAULT_REQUEST_INTERVAL = 0.5
+
+# 커넥션 풀 설정 (호스트별 keep-alive 연결 유지)
+POOL_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# 조건부 요청을 위해 기억할 최대 URL 수
+MAX_CACHED_PAGES = 256
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def prefix_rewriter(base_url: str) -> Callable[[str], str]:
+    """
+    https://host/path?q -> {base_url}/host/path?q 로 바꾸는 URL 변환기 (벤치마크 스텁 서버용)
+    """
+    base_url = base_url.rstrip("/")
+
+    def rewrite(url: str) -> str:
+        parsed = urlparse(url)
+        query = f"?{parsed.query}" if parsed.query else ""
+        return f"{base_url}/{parsed.netloc}{parsed.path or '/'}{query}"
+
+    return rewrite
+
+
+# 요청 URL 변환 훅 (벤치마크 스텁 서버 등으로 요청을 돌릴 때 사용, None이면 원래 URL로 요청)
+# 속도 제한, 조건부 요청 캐시, 메트릭은 원래 URL 기준으로 동작
+# CRAWLER_STUB_URL이 있으면 모든 요청을 해당 서버로 보냄 (예: http://127.0.0.1:8765)
+_url_rewriter: Optional[Callable[[str], str]] = (
+    prefix_rewriter(os.environ["CRAWLER_STUB_URL"]) if os.getenv("CRAWLER_STUB_URL") else None
+)
+
+
+class Page:
+    """
+    가져온 페이지 (원본 바이트와 인코딩, 본문 해시, 검증자)
+    text는 처음 사용할 때 디코딩 (파싱 프로세스로는 바이트를 그대로 전달)
+    """
+
+    def __init__(self, url: str, content: bytes, encoding: str, digest: str,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = decode_content(self.content, self.encoding)
+        return self._text
+
+
+def decode_content(content: bytes, encoding: str) -> str:
+    """
+    응답 바이트를 문자열로 (httpx Response.text와 같이 잘못된 바이트는 대체 문자로)
+    """
+    return content.decode(encoding or "utf-8", errors="replace")
+
+
+# URL별 마지막 페이지 (LRU)
+_pages: "OrderedDict[str, Page]" = OrderedDict()
+
+
+class HostRateLimiter:
+    """
+    호스트별 최소 간격 제한기
+    요청마다 다음 전송 시각을 예약하므로 동시 요청도 도착 순서대로 간격을 두고 전송됨
+    """
+
+    def __init__(self, default_interval: float = DEFAULT_REQUEST_INTERVAL):
+        self.default_interval = default_interval
+        self._intervals: Dict[str, float] = {}
+        self._next_at: Dict[str, float] = {}
+
+    def configure(self, host: str, interval: float):
+        """
+        호스트의 최소 요청 간격 설정
+        """
+        self._intervals[host] = interval
+
+    def interval_for(self, host: str) -> float:
+        return self._intervals.get(host, self.default_interval)
+
+    async def acquire(self, host: str):
+        """
+        호스트에 요청을 보낼 차례가 될 때까지 대기
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_at.get(host, 0.0))
+        self._next_at[host] = slot + self.interval_for(host)
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+rate_limiter = HostRateLimiter()
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    공유 AsyncClient 반환 (최초 호출 시 생성)
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=get_default_headers(),
+            timeout=DEFAULT_TIMEOUT,
+            limits=POOL_LIMITS,
+            follow_redirects=True,
+        )
+    return _client
+
+
+async def close_client():
+    """
+    공유 클라이언트 종료 (앱 종료 시 호출)
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def set_request_interval(url: str, interval: float):
+    """
+    URL의 호스트에 대한 최소 요청 간격 설정 (샵별 설정)
+    """
+    rate_limiter.configure(urlparse(url).netloc, interval)
+
+
+def set_url_rewriter(rewriter: Optional[Callable[[str], str]]):
+    """
+    요청 URL 변환 훅 설정 (None이면 해제)
+    """
+    global _url_rewriter
+    _url_rewriter = rewriter
+
+
+async def _get(url: str, headers: Optional[Dict[str, str]], timeout: float) -> httpx.Response:
+    """
+    속도 제한을 거쳐 GET 요청 (요청 시간, 바이트 수, 상태 코드, 타임아웃을 메트릭에 기록)
+    크롤링 마감 시간이 있으면 타임아웃을 남은 시간으로 줄이고, 이미 지났으면 CrawlCancelled
+    """
+    host = urlparse(url).netloc
+    await rate_limiter.acquire(host)
+    budget = progress.time_budget(timeout)
+    start = time.perf_counter()
+    try:
+        target = _url_rewriter(url) if _url_rewriter is not None else url
+        request = get_client().get(target, headers=headers, timeout=budget)
+        if budget < timeout:
+            # httpx 타임아웃은 읽기 단위이므로, 마감 시간이 걸린 요청은 전체 시간도 제한
+            try:
+                response = await asyncio.wait_for(request, budget)
+            except asyncio.TimeoutError:
+                raise progress.CrawlCancelled("Deadline exceeded")
+        else:
+            response = await request
+    except (httpx.TimeoutException, progress.CrawlCancelled):
+        metrics.fetch_timeouts.inc(host)
+        metrics.fetch_requests.inc(host, "error")
+        raise
+    except httpx.HTTPError:
+        metrics.fetch_requests.inc(host, "error")
+        raise
+    finally:
+        metrics.fetch_seconds.observe(host, value=time.perf_counter() - start)
+    metrics.fetch_requests.inc(host, str(response.status_code))
+    metrics.fetch_bytes.inc(host, amount=len(response.content))
+    return response
+
+
+async def fetch(url: str, timeout: float = DEFAULT_TIMEOUT) -> httpx.Response:
+    """
+    URL 요청 후 응답 반환 (HTTP 오류 시 예외 발생)
+    """
+    response = await _get(url, None, timeout)
+    response.raise_for_status()
+    return response
+
+
+async def fetch_page(url: str, timeout: float = DEFAULT_TIMEOUT) -> Page:
+    """
+    조건부 요청으로 페이지 조회
+    이전 응답의 ETag/Last-Modified가 있으면 If-None-Match/If-Modified-Since를 보내고,
+    304 응답이면 이전 본문을 그대로 반환
+    """
+    previous = _pages.get(url)
+    headers = {}
+    if previous is not None:
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+    response = await _get(url, headers, timeout)
+    if response.status_code == 304 and previous is not None:
+        _pages.move_to_end(url)
+        return Page(url, previous.content, previous.encoding, previous.digest,
+                    previous.etag, previous.last_modified)
+    response.raise_for_status()
+
+    page = Page(
+        url,
+        response.content,
+        response.encoding,
+        hashlib.sha1(response.content).hexdigest(),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    _pages[url] = page
+    _pages.move_to_end(url)
+    while len(_pages) > MAX_CACHED_PAGES:
+        _pages.popitem(last=False)
+    return page
+
+
+async def fetch_text(url: str, timeout: float = DEFAULT_TIMEOUT) -> str:
+    """
+    URL 요청 후 본문 텍스트 반환
+    """
+    response = await fetch(url, timeout=timeout)
+    return response.text
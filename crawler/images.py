@@ -0,0 +1,256 @@
+"""
+이미지 캐시와 썸네일 프록시
+크롤링한 Pet의 이미지를 URL별로 한 번만 내려받아 썸네일로 줄여 디스크에 저장하고,
+/api/images/{key}에서 긴 캐시 헤더와 함께 제공 (브라우저가 샵 서버에서 원본을 받지 않도록)
+- 다운로드는 크기가 제한된 백그라운드 대기열에서 처리 (가득 차면 버리고 다음 크롤링 때 다시 시도)
+- 디스크 캐시는 전체 크기 제한 LRU
+"""
+import asyncio
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+import metrics
+from fetcher import fetch
+
+# 이미지 캐시 설정
+IMAGES_ENABLED = os.getenv("CRAWLER_IMAGE_CACHE", "0") == "1"
+IMAGE_DIR = os.getenv("CRAWLER_IMAGE_DIR", str(Path(__file__).parent / "data" / "images"))
+IMAGE_CACHE_BYTES = int(float(os.getenv("CRAWLER_IMAGE_CACHE_MB", "512")) * 1024 * 1024)
+THUMBNAIL_SIZE = int(os.getenv("CRAWLER_THUMBNAIL_SIZE", "320"))
+THUMBNAIL_QUALITY = 80
+IMAGE_QUEUE_SIZE = int(os.getenv("CRAWLER_IMAGE_QUEUE", "1000"))
+IMAGE_WORKERS = int(os.getenv("CRAWLER_IMAGE_WORKERS", "4"))
+
+# 원본 이미지 최대 크기 (이보다 크면 내려받지 않음)
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+# 실패한 URL을 다시 시도하기까지의 시간 (초)
+RETRY_AFTER = 3600.0
+# 원본 URL과 실패 시각을 기억할 최대 URL 수 (각각 최근 사용 순 LRU)
+MAX_TRACKED_URLS = 20000
+
+# 썸네일 주소 경로 (main.py의 /api/images/{key})
+THUMBNAIL_PATH = "/api/images/{key}"
+KEY_RE = re.compile(r"^[0-9a-f]{20}$")
+
+
+def image_key(url: str) -> str:
+    """
+    이미지 URL의 캐시 키
+    """
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:20]
+
+
+def thumbnail_url(image_url: str) -> str:
+    """
+    Pet.thumbnail 값 (이미지 캐시가 꺼져 있거나 원격 이미지가 아니면 빈 문자열)
+    """
+    if not IMAGES_ENABLED or not image_url.startswith(("http://", "https://")):
+        return ""
+    return THUMBNAIL_PATH.format(key=image_key(image_url))
+
+
+def make_thumbnail(data: bytes, size: int = THUMBNAIL_SIZE, quality: int = THUMBNAIL_QUALITY) -> bytes:
+    """
+    원본 이미지 바이트를 size x size 안에 들어가는 JPEG 썸네일로 변환
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        # JPEG는 디코딩 단계에서 축소하여 큰 원본도 빠르게 처리
+        img.draft("RGB", (size, size))
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((size, size))
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        out = io.BytesIO()
+        img.save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+        return out.getvalue()
+
+
+class ThumbnailCache:
+    """
+    디스크 썸네일 캐시 (전체 크기 제한 LRU)
+    파일은 {directory}/{key[:2]}/{key}.jpg, 최근 사용 순서는 메모리에서 관리 (시작 시 수정 시각 순으로 복원)
+    """
+
+    def __init__(self, directory: str = IMAGE_DIR, max_bytes: int = IMAGE_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def open(self):
+        """
+        디스크에 있는 썸네일 목록 불러오기
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files: List[Tuple[float, str, int]] = []
+        for path in self.directory.glob("*/*.jpg"):
+            stat = path.stat()
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            for _, key, size in sorted(files):
+                self._entries[key] = size
+                self._size += size
+        self._evict()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.jpg"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        썸네일 파일 경로 (없으면 None, 있으면 최근 사용으로 표시)
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        return self.path_for(key)
+
+    def put(self, key: str, data: bytes):
+        """
+        썸네일 저장 (임시 파일에 쓴 뒤 교체) 후 용량 초과분을 오래된 순으로 삭제
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+        self._evict()
+
+    def _evict(self):
+        while True:
+            with self._lock:
+                if self._size <= self.max_bytes or not self._entries:
+                    return
+                key, size = self._entries.popitem(last=False)
+                self._size -= size
+            try:
+                self.path_for(key).unlink()
+            except FileNotFoundError:
+                pass
+
+
+class ImagePipeline:
+    """
+    이미지 다운로드/썸네일 생성 백그라운드 대기열
+    - submit: 캐시에 없고 대기 중이 아닌 URL만 대기열에 추가 (가득 차면 버림)
+    - 워커: fetcher로 원본을 받아(호스트별 요청 간격 적용) 스레드 풀에서 썸네일 생성 후 저장
+    """
+
+    def __init__(self, cache: ThumbnailCache, queue_size: int = IMAGE_QUEUE_SIZE,
+                 workers: int = IMAGE_WORKERS):
+        self.cache = cache
+        self.queue_size = queue_size
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pending = set()
+        self._failed: "OrderedDict[str, float]" = OrderedDict()
+        # 키 -> 원본 URL (썸네일이 아직 없을 때 원본으로 보내기 위해 기억)
+        self._urls: "OrderedDict[str, str]" = OrderedDict()
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._pending.clear()
+
+    def original_url(self, key: str) -> Optional[str]:
+        return self._urls.get(key)
+
+    @staticmethod
+    def _remember(entries: OrderedDict, key: str, value):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > MAX_TRACKED_URLS:
+            entries.popitem(last=False)
+
+    def submit(self, url: str) -> bool:
+        """
+        이미지 URL을 대기열에 추가 (추가했으면 True)
+        """
+        if self._queue is None or not url.startswith(("http://", "https://")):
+            return False
+        key = image_key(url)
+        self._remember(self._urls, key, url)
+        if key in self.cache or url in self._pending:
+            return False
+        failed_at = self._failed.get(url)
+        if failed_at is not None and time.monotonic() - failed_at < RETRY_AFTER:
+            return False
+        try:
+            self._queue.put_nowait(url)
+        except asyncio.QueueFull:
+            metrics.image_requests.inc("dropped")
+            return False
+        self._pending.add(url)
+        return True
+
+    def submit_many(self, urls: Iterable[str]) -> int:
+        return sum(1 for url in urls if self.submit(url))
+
+    async def _worker(self):
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            url = await queue.get()
+            try:
+                response = await fetch(url)
+                if len(response.content) > MAX_IMAGE_BYTES:
+                    raise ValueError(f"image too large ({len(response.content)} bytes)")
+                # 디코딩/축소/인코딩은 CPU 작업이므로 스레드 풀에서 실행
+                data = await loop.run_in_executor(None, make_thumbnail, response.content)
+                await loop.run_in_executor(None, self.cache.put, image_key(url), data)
+                self._failed.pop(url, None)
+                metrics.image_requests.inc("stored")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"이미지 처리 오류 ({url}): {e}")
+                self._remember(self._failed, url, time.monotonic())
+                metrics.image_requests.inc("failed")
+            finally:
+                self._pending.discard(url)
+                queue.task_done()
+
+    def status(self) -> dict:
+        return {
+            "enabled": IMAGES_ENABLED,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "pending": len(self._pending),
+            "cached": len(self.cache),
+            "cacheBytes": self.cache.size,
+            "failed": len(self._failed),
+        }
@@ -10,27 +10,101 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.responses import FileResponse, PlainTextResponse, RedirectResponse, StreamingResponse
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import json
+import time
 
+import httpx
+
+import metrics
+import parse_pool
+from progress import CrawlCancelled, CrawlProgress, current_progress
 from models import CrawlResult, CrawlRequest, CrawlResponse, Pet
-from crawlers import (
-    crawl_zooseyo,
-    crawl_yourpet,
-    crawl_meyoupet,
-    crawl_meyoupet_gwangju,
-    crawl_petworldkorea,
-    crawl_petami,
-    crawl_adamspet,
-    crawl_petkas,
-    crawl_petfree,
-    crawl_dorothypet,
+from fetcher import get_client, close_client
+from scheduler import CrawlScheduler
+from cache import ResultCache
+from store import PetStore
+from catalog import PetIndex
+from refresher import AdaptiveRefresher
+from images import IMAGES_ENABLED, KEY_RE, ImagePipeline, ThumbnailCache
+from registry import default_registry
+from dedup import dedupe_results
+from serialize import CompressionMiddleware, dumps, encode_crawl_response, encode_result, json_response
+
+# 크롤러 레지스트리 (기본 크롤러 + 엔트리 포인트, 모듈은 처음 크롤링할 때 import)
+crawler_registry = default_registry()
+
+# 크롤링 스케줄러 (전역/호스트별 동시 실행 제한)
+scheduler = CrawlScheduler(
+    max_concurrency=int(os.getenv("CRAWLER_MAX_CONCURRENCY", "10")),
+    per_host_limit=int(os.getenv("CRAWLER_PER_HOST_LIMIT", "1")),
 )
 
-app = FastAPI(title="Pet Crawler API", version="1.0.0")
+# 샵별 크롤링 결과 캐시 (TTL 초과 시 이전 결과를 반환하고 백그라운드에서 갱신)
+result_cache = ResultCache(ttl=float(os.getenv("CRAWL_CACHE_TTL", "300")))
+
+# Pet 영구 저장소 (SQLite)
+pet_store = PetStore(os.getenv("CRAWLER_DB_PATH", str(current_dir / "data" / "pets.db")))
+
+# /api/pets 조회용 메모리 인덱스 (저장소에서 초기화, 크롤링마다 갱신)
+pet_index = PetIndex()
+
+# 백그라운드 주기 크롤러 (CRAWLER_AUTO_REFRESH=1일 때 실행)
+refresher = AdaptiveRefresher(
+    list(crawler_registry),
+    lambda shop_id: schedule_crawler(shop_id),
+    initial_interval=float(os.getenv("CRAWLER_REFRESH_INITIAL", "300")),
+    min_interval=float(os.getenv("CRAWLER_REFRESH_MIN", "60")),
+    max_interval=float(os.getenv("CRAWLER_REFRESH_MAX", "3600")),
+)
+AUTO_REFRESH = os.getenv("CRAWLER_AUTO_REFRESH", "0") == "1"
+
+# 이미지 썸네일 캐시와 다운로드 대기열 (CRAWLER_IMAGE_CACHE=1일 때 실행)
+image_pipeline = ImagePipeline(ThumbnailCache())
+
+# 백그라운드 갱신 작업 (GC 방지를 위해 참조 유지)
+_refresh_tasks = set()
+
+# 대기 중이거나 실행 중인 크롤링의 진행 상황 (마감 시간, 부분 결과)
+_progress: Dict[str, CrawlProgress] = {}
+
+# /api/crawl?deadline=의 추가 대기 시간 (초) - 크롤러가 체크포인트에서 멈추고 결과를 돌려줄 여유
+DEADLINE_GRACE = float(os.getenv("CRAWLER_DEADLINE_GRACE", "0.1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기 동안 공유 HTTP 클라이언트와 스케줄러 유지
+    """
+    get_client()
+    pet_store.open()
+    pet_index.load(pet_store.get_pets())
+    await scheduler.start()
+    # CRAWLER_PARSE_WORKERS > 0이면 파싱 프로세스를 미리 시작
+    parse_pool.start()
+    if IMAGES_ENABLED:
+        image_pipeline.cache.open()
+        await image_pipeline.start()
+    if AUTO_REFRESH:
+        await refresher.start()
+    yield
+    await refresher.stop()
+    await image_pipeline.stop()
+    for task in list(_refresh_tasks):
+        task.cancel()
+    await scheduler.stop()
+    parse_pool.stop()
+    await close_client()
+    pet_store.close()
+
+
+app = FastAPI(title="Pet Crawler API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정 (Next.js에서 호출 가능하도록)
 app.add_middleware(
@@ -41,40 +115,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 크롤러 매핑
-CRAWLER_MAP = {
-    "zooseyo": crawl_zooseyo,
-    "yourpet": crawl_yourpet,
-    "meyoupet": crawl_meyoupet,
-    "meyoupet-gwangju": crawl_meyoupet_gwangju,
-    "petworldkorea": crawl_petworldkorea,
-    "petami": crawl_petami,
-    "adamspet": crawl_adamspet,
-    "petkas": crawl_petkas,
-    "petfree": crawl_petfree,
-    "dorothypet": crawl_dorothypet,
-}
+# 큰 JSON 응답 gzip 압축 (CRAWLER_GZIP_MIN_SIZE 바이트 이상)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("CRAWLER_GZIP_MIN_SIZE", "1024")),
+    compresslevel=6,
+)
 
 
-def run_crawler(crawler_func, shop_id: str, shop_name: str) -> CrawlResult:
+async def run_crawler(crawler_func, shop_id: str, shop_name: str) -> CrawlResult:
     """
-    크롤러 함수 실행 (동기 함수를 스레드에서 실행)
+    크롤러 코루틴 실행 (I/O는 이벤트 루프에서 처리)
+    실행 시간과 결과(success/failure/timeout)를 메트릭에 기록
     """
+    start = time.perf_counter()
+    outcome = "failure"
     try:
-        pets = crawler_func()
-        # pets가 이미 Pet 객체 리스트이므로 그대로 사용
-        # 만약 dict 리스트인 경우에만 Pet 객체로 변환
-        pet_list = []
-        for pet in pets:
-            if isinstance(pet, Pet):
-                pet_list.append(pet)
-            elif isinstance(pet, dict):
-                pet_list.append(Pet(**pet))
-            else:
-                # Pet 모델이 아닌 경우 dict로 변환 시도
-                pet_list.append(Pet(**pet.dict() if hasattr(pet, 'dict') else pet))
-        
-        return CrawlResult(
+        pets = await crawler_func()
+        # 엔진이 만든 Pet은 이미 검증되었으므로 그대로 사용 (플러그인 크롤러가 dict를 반환한 경우만 변환)
+        pet_list = [pet if isinstance(pet, Pet) else Pet.model_validate(pet) for pet in pets]
+        if not pet_list:
+            # 차단/점검 페이지처럼 목록 컨테이너가 없는 응답을 성공으로 저장하면 샵 전체가 비활성화되므로 실패로 처리
+            raise RuntimeError("No listings found")
+
+        outcome = "success"
+        metrics.crawl_pets.inc(shop_id, amount=len(pet_list))
+        # 검증된 Pet 목록을 다시 검증하지 않도록 바로 생성
+        return CrawlResult.model_construct(
             success=True,
             shopId=shop_id,
             shopName=shop_name,
@@ -82,6 +149,13 @@ def run_crawler(crawler_func, shop_id: str, shop_name: str) -> CrawlResult:
             count=len(pet_list),
         )
     except Exception as e:
+        if isinstance(e, (httpx.TimeoutException, asyncio.TimeoutError, CrawlCancelled)):
+            outcome = "timeout"
+        progress = current_progress.get()
+        if progress is not None and progress.expired:
+            # 마감 시간 초과: 그때까지 파싱한 Pet을 부분 결과로 반환 (캐시하지 않음)
+            outcome = "timeout"
+            return timed_out_result(shop_id, shop_name, progress)
         import traceback
         error_msg = f"{str(e)}\n{traceback.format_exc()}"
         return CrawlResult(
@@ -92,6 +166,108 @@ def run_crawler(crawler_func, shop_id: str, shop_name: str) -> CrawlResult:
             count=0,
             error=error_msg,
         )
+    finally:
+        metrics.crawl_runs.inc(shop_id, outcome)
+        metrics.crawl_seconds.observe(shop_id, outcome, value=time.perf_counter() - start)
+
+
+def shop_display_name(shop_id: str) -> str:
+    return shop_id.replace("-", " ").title()
+
+
+def timed_out_result(shop_id: str, shop_name: str, progress: Optional[CrawlProgress]) -> CrawlResult:
+    """
+    마감 시간을 넘긴 크롤링의 결과 (진행 상황에 기록된 Pet을 부분 결과로 포함)
+    """
+    pets = list(progress.pets) if progress is not None else []
+    return CrawlResult(
+        success=False,
+        shopId=shop_id,
+        shopName=shop_name,
+        pets=pets,
+        count=len(pets),
+        error="Deadline exceeded",
+        partial=True,
+    )
+
+
+async def crawl_and_cache(shop_id: str) -> CrawlResult:
+    """
+    크롤러 실행 후 성공한 결과를 캐시와 저장소에 반영
+    진행 상황(마감 시간, 부분 결과)은 컨텍스트 변수로 크롤러에 전달
+    """
+    crawler_func = crawler_registry.get(shop_id)
+    shop_name = shop_display_name(shop_id)
+    progress = _progress.setdefault(shop_id, CrawlProgress())
+    token = current_progress.set(progress)
+    try:
+        result = await run_crawler(crawler_func, shop_id, shop_name)
+        if result.success:
+            # SQLite 쓰기는 블로킹이므로 기본 스레드 풀에서 실행
+            # 변경 버전을 결과에 기록한 뒤 캐시 (캐시된 결과는 인코딩이 재사용되므로 이후 수정하지 않음)
+            # 저장 실패(database is locked, 디스크 부족 등)는 기록만 하고 크롤링 결과는 그대로 캐시하고 반환 (버전은 0)
+            loop = asyncio.get_running_loop()
+            try:
+                result.version = await loop.run_in_executor(
+                    None, pet_store.sync_shop, shop_id, result.pets)
+            except Exception as e:
+                print(f"{shop_name} 저장 오류: {e}")
+            result_cache.set(shop_id, result)
+            pet_index.replace_shop(shop_id, result.pets)
+            # 썸네일이 없는 이미지만 백그라운드 대기열에 추가
+            image_pipeline.submit_many(pet.image for pet in result.pets)
+        return result
+    finally:
+        current_progress.reset(token)
+        if _progress.get(shop_id) is progress:
+            del _progress[shop_id]
+
+
+async def schedule_crawler(shop_id: str, deadline: Optional[float] = None) -> CrawlResult:
+    """
+    스케줄러를 통해 크롤러 실행 (같은 샵의 동시 요청은 하나의 크롤링을 공유)
+    deadline: time.monotonic() 기준 마감 시각 (공유 크롤링은 기다리는 요청 중 가장 늦은 마감 시각 사용)
+    """
+    progress = _progress.get(shop_id)
+    if progress is None:
+        _progress[shop_id] = CrawlProgress(deadline)
+    else:
+        progress.extend(deadline)
+    return await scheduler.submit(
+        shop_id,
+        crawler_registry.host(shop_id),
+        lambda: crawl_and_cache(shop_id),
+    )
+
+
+def refresh_in_background(shop_id: str):
+    """
+    오래된 캐시 항목을 백그라운드에서 갱신
+    """
+    task = asyncio.create_task(schedule_crawler(shop_id))
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def get_crawl_result(shop_id: str, force: bool = False,
+                           deadline: Optional[float] = None) -> CrawlResult:
+    """
+    캐시를 거쳐 크롤링 결과 조회
+    - 신선한 캐시: 바로 반환
+    - 오래된 캐시: 바로 반환하고 백그라운드에서 갱신
+    - 캐시 없음 또는 force=True: 크롤링 완료까지 대기
+    """
+    if not force:
+        entry = result_cache.get(shop_id)
+        if entry is not None:
+            if not result_cache.is_fresh(entry):
+                metrics.cache_requests.inc(shop_id, "stale")
+                refresh_in_background(shop_id)
+            else:
+                metrics.cache_requests.inc(shop_id, "fresh")
+            return entry.value
+        metrics.cache_requests.inc(shop_id, "miss")
+    return await schedule_crawler(shop_id, deadline)
 
 
 @app.get("/")
@@ -99,66 +275,266 @@ async def root():
     return {"message": "Pet Crawler API", "version": "1.0.0"}
 
 
-@app.get("/api/crawl")
-async def crawl_all():
+@app.get("/api/crawl", response_model=CrawlResponse)
+async def crawl_all(request: Request, force: bool = False,
+                    deadline: Optional[float] = Query(None, gt=0), dedupe: bool = False):
     """
-    모든 사이트 크롤링
+    모든 사이트 크롤링 (force=true면 캐시를 무시하고 다시 크롤링)
+    dedupe=true면 여러 샵에 올라온 같은 동물을 대표 Pet 하나로 묶고 나머지는 alternates로 포함
+    deadline: 응답 마감 시간 (초). 마감 안에 끝나지 않은 샵은 협조적으로 중단하고
+    failed에 timedOut으로 보고하며, 그때까지 파싱한 Pet은 partial 결과로 포함
     """
-    executor = ThreadPoolExecutor(max_workers=5)
-    loop = asyncio.get_event_loop()
-    
-    # 모든 크롤러를 병렬로 실행
-    tasks = []
-    for shop_id, crawler_func in CRAWLER_MAP.items():
-        shop_name = shop_id.replace("-", " ").title()
-        task = loop.run_in_executor(executor, run_crawler, crawler_func, shop_id, shop_name)
-        tasks.append(task)
-    
-    results = await asyncio.gather(*tasks)
-    
-    # 성공/실패 분리
-    success_results = [r for r in results if r.success]
-    failed_results = [
-        {"shopId": r.shopId, "error": r.error} for r in results if not r.success
+    shop_ids = list(crawler_registry)
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+    # 캐시에 없는 샵만 스케줄러에 등록하여 병렬로 실행
+    tasks = [
+        asyncio.ensure_future(get_crawl_result(shop_id, force, deadline_at))
+        for shop_id in shop_ids
     ]
+    if deadline is None:
+        results = await asyncio.gather(*tasks)
+    else:
+        # 크롤러가 체크포인트에서 스스로 멈출 시간을 조금 더 준 뒤, 남은 샵은 기다리지 않음
+        await asyncio.wait(tasks, timeout=deadline + DEADLINE_GRACE)
+        results = []
+        for shop_id, task in zip(shop_ids, tasks):
+            if task.done():
+                results.append(task.result())
+            else:
+                task.cancel()
+                results.append(
+                    timed_out_result(shop_id, shop_display_name(shop_id), _progress.get(shop_id))
+                )
+    
+    # 성공/실패 분리 (마감 시간을 넘긴 샵의 부분 결과는 results에도 포함)
+    success_results = [r for r in results if r.success or (r.partial and r.pets)]
+    failed_results = []
+    for r in results:
+        if r.success:
+            continue
+        failed = {"shopId": r.shopId, "error": r.error}
+        if r.partial:
+            failed["timedOut"] = True
+            failed["partialCount"] = r.count
+        failed_results.append(failed)
+
+    duplicates = 0
+    if dedupe:
+        success_results, duplicates = dedupe_results(success_results)
     
     total = sum(r.count for r in success_results)
+    # 각 샵 결과에 반영된 변경 버전 중 최신 (클라이언트는 이 버전부터 /api/changes로 이어서 조회)
+    version = max((r.version for r in success_results), default=0)
     
-    return CrawlResponse(
-        success=True,
-        results=success_results,
-        failed=failed_results,
-        total=total,
-    )
+    # CrawlResponse 형식 그대로 직렬화 (샵별 결과는 인코딩한 바이트를 재사용)
+    return json_response(
+        encode_crawl_response(success_results, failed_results, total, duplicates, version), request)
 
 
-@app.get("/api/crawl/{shop_id}")
-async def crawl_shop(shop_id: str):
+@app.get("/api/crawl/stream")
+async def crawl_all_stream(force: bool = False):
     """
-    특정 사이트 크롤링
+    모든 사이트 크롤링 (NDJSON 스트리밍)
+    각 샵의 크롤링이 끝나는 즉시 한 줄씩 전송하고, 마지막에 요약 프레임 전송
+    - {"type": "result", "result": CrawlResult}
+    - {"type": "summary", "success": true, "total": N, "count": 샵 수, "failed": [...]}
     """
-    if shop_id not in CRAWLER_MAP:
+    async def generate():
+        tasks = [
+            asyncio.ensure_future(get_crawl_result(shop_id, force))
+            for shop_id in crawler_registry
+        ]
+        total = 0
+        failed_results = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result.success:
+                    total += result.count
+                else:
+                    failed_results.append({"shopId": result.shopId, "error": result.error})
+                yield b'{"type":"result","result":' + encode_result(result) + b'}\n'
+            summary = {
+                "type": "summary",
+                "success": True,
+                "total": total,
+                "count": len(tasks),
+                "failed": failed_results,
+            }
+            yield json.dumps(summary, ensure_ascii=False) + "\n"
+        finally:
+            # 클라이언트 연결이 끊긴 경우 남은 대기 작업 정리 (공유 크롤링은 계속 진행)
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.get("/api/crawl/{shop_id}", response_model=CrawlResult)
+async def crawl_shop(shop_id: str, request: Request, force: bool = False):
+    """
+    특정 사이트 크롤링 (force=true면 캐시를 무시하고 다시 크롤링)
+    """
+    if shop_id not in crawler_registry:
         raise HTTPException(status_code=404, detail=f"Shop {shop_id} not found")
     
-    crawler_func = CRAWLER_MAP[shop_id]
-    shop_name = shop_id.replace("-", " ").title()
-    
-    executor = ThreadPoolExecutor(max_workers=1)
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(executor, run_crawler, crawler_func, shop_id, shop_name)
+    result = await get_crawl_result(shop_id, force)
     
     if not result.success:
         raise HTTPException(status_code=500, detail=result.error)
     
-    return result
+    return json_response(encode_result(result), request)
+
+
+@app.get("/api/pets")
+async def list_pets(
+    request: Request,
+    type: Optional[str] = None,
+    breed: Optional[str] = None,
+    shop_id: Optional[str] = Query(None, alias="shopId"),
+    gender: Optional[str] = None,
+    location: Optional[str] = None,
+    min_price: Optional[int] = Query(None, alias="minPrice"),
+    max_price: Optional[int] = Query(None, alias="maxPrice"),
+    sort: str = "-crawledAt",
+    limit: int = 20,
+    cursor: Optional[str] = None,
+):
+    """
+    크롤링된 Pet 조회 (필터, 정렬, 커서 페이지네이션)
+    sort: price | crawledAt | name (앞에 -를 붙이면 내림차순)
+    응답의 nextCursor를 다음 요청의 cursor로 전달
+    """
+    filters = {
+        "type": type,
+        "breed": breed,
+        "shopId": shop_id,
+        "gender": gender,
+        "location": location,
+    }
+    try:
+        page = pet_index.query(
+            filters,
+            min_price=min_price,
+            max_price=max_price,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(dumps(page), request)
+
+
+@app.get("/api/changes")
+async def list_changes(
+    request: Request,
+    since: int = Query(0, ge=0),
+    shop_id: Optional[str] = Query(None, alias="shopId"),
+):
+    """
+    since 버전 이후의 변경 (샵별 added / changed / removed)
+    응답의 version을 다음 요청의 since로 전달. reset=true면 이력이 삭제되어 전체를 다시 받아야 함
+    """
+    if shop_id is not None and shop_id not in crawler_registry:
+        raise HTTPException(status_code=404, detail=f"Shop {shop_id} not found")
+    loop = asyncio.get_running_loop()
+    changes = await loop.run_in_executor(None, pet_store.changes_since, since, shop_id)
+    return json_response(dumps(changes), request)
+
+
+@app.get("/api/prices/stats")
+async def price_stats(
+    request: Request,
+    group_by: str = Query("breed", alias="groupBy"),
+    days: float = Query(30, gt=0),
+    percentiles: str = "25,50,75",
+    type: Optional[str] = None,
+    breed: Optional[str] = None,
+    shop_id: Optional[str] = Query(None, alias="shopId"),
+):
+    """
+    최근 days일 가격 통계 (groupBy: breed | type | shopId)
+    그룹별 개수, 최소/최대/평균, 백분위수 (percentiles=10,50,90 형식, 기본 25,50,75)
+    """
+    try:
+        quantiles = [float(q) for q in percentiles.split(",") if q.strip()]
+        stats = pet_store.prices.stats(
+            group_by,
+            days=days,
+            percentiles=quantiles,
+            filters={"type": type, "breed": breed, "shopId": shop_id},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(dumps(stats), request)
+
+
+@app.get("/api/prices/{pet_id}")
+async def price_history(pet_id: str):
+    """
+    Pet 하나의 가격 이력
+    """
+    history = pet_store.prices.history(pet_id)
+    if not history:
+        raise HTTPException(status_code=404, detail=f"No price history for {pet_id}")
+    return json_response(dumps({"id": pet_id, "history": history}))
+
+
+@app.get("/api/refresh")
+async def refresh_status():
+    """
+    백그라운드 주기 크롤러 상태 (샵별 주기, 실행/변경 횟수)
+    """
+    return {"enabled": AUTO_REFRESH, "shops": refresher.status()}
+
+
+@app.get("/api/images")
+async def image_status():
+    """
+    이미지 캐시/대기열 상태
+    """
+    return image_pipeline.status()
+
+
+@app.get("/api/images/{key}")
+async def get_image(key: str):
+    """
+    썸네일 이미지 (캐시 키는 원본 URL에서 정해지므로 내용이 바뀌지 않아 오래 캐시)
+    아직 썸네일이 없으면 대기열에 추가하고 원본 이미지로 임시 리다이렉트
+    """
+    if not KEY_RE.match(key):
+        raise HTTPException(status_code=404, detail="Image not found")
+    path = image_pipeline.cache.get(key)
+    if path is not None and path.exists():
+        return FileResponse(
+            path,
+            media_type="image/jpeg",
+            headers={"Cache-Control": "public, max-age=31536000, immutable"},
+        )
+    url = image_pipeline.original_url(key)
+    if url is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    image_pipeline.submit(url)
+    return RedirectResponse(url, status_code=302, headers={"Cache-Control": "no-store"})
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    Prometheus 텍스트 형식 메트릭 (요청 시간/바이트, 파싱 시간, 페이지당 아이템 수, 실패/타임아웃)
+    """
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
 
 
 @app.post("/api/crawl/{shop_id}")
-async def crawl_shop_post(shop_id: str):
+async def crawl_shop_post(shop_id: str, http_request: Request,
+                          request: Optional[CrawlRequest] = None):
     """
-    POST로 특정 사이트 크롤링
+    POST로 특정 사이트 크롤링 (본문의 force 플래그 지원)
     """
-    return await crawl_shop(shop_id)
+    force = request.force if request is not None else False
+    return await crawl_shop(shop_id, http_request, force=force)
 
 
 if __name__ == "__main__":
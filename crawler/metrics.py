@@ -0,0 +1,165 @@
+"""
+크롤러 메트릭 (Prometheus 텍스트 형식)
+외부 라이브러리 없이 카운터/히스토그램을 메모리에 모으고 /metrics에서 노출
+"""
+import math
+from typing import Dict, List, Sequence, Tuple
+
+# 기본 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 파싱 시간 구간 (초)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# 페이지당 아이템 수 구간
+COUNT_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 200, 500)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """
+    단조 증가 카운터 (레이블 값 조합별)
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = tuple(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    """
+    누적 구간 히스토그램 (레이블 값 조합별 구간 개수, 합계, 개수)
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, *labels: str, value: float):
+        key = tuple(labels)
+        state = self._values.get(key)
+        if state is None:
+            # [구간별 개수, 합계, 개수]
+            state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+        counts = state[0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        state[1] += value
+        state[2] += 1
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    메트릭 모음 (등록 순서대로 출력)
+    """
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식 (version 0.0.4)
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# 네트워크 (fetcher)
+fetch_seconds = registry.histogram(
+    "crawler_fetch_seconds", "HTTP 요청 시간 (속도 제한 대기 제외)", ("host",))
+fetch_bytes = registry.counter(
+    "crawler_fetch_bytes_total", "내려받은 본문 바이트 수", ("host",))
+fetch_requests = registry.counter(
+    "crawler_fetch_requests_total", "HTTP 요청 수 (상태 코드별, 실패는 error)", ("host", "status"))
+fetch_timeouts = registry.counter(
+    "crawler_fetch_timeouts_total", "타임아웃된 HTTP 요청 수", ("host",))
+
+# 파싱 (engine)
+parse_seconds = registry.histogram(
+    "crawler_parse_seconds", "목록 페이지 하나의 파싱 시간", ("shop",), buckets=PARSE_BUCKETS)
+page_items = registry.histogram(
+    "crawler_page_items", "목록 페이지당 아이템 수", ("shop",), buckets=COUNT_BUCKETS)
+item_failures = registry.counter(
+    "crawler_item_failures_total", "처리 중 오류가 난 아이템 수", ("shop",))
+
+# 크롤링 실행 (main.run_crawler)
+crawl_seconds = registry.histogram(
+    "crawler_crawl_seconds", "샵 크롤링 전체 시간", ("shop", "outcome"))
+crawl_runs = registry.counter(
+    "crawler_crawl_runs_total", "샵 크롤링 실행 수 (success/failure/timeout)", ("shop", "outcome"))
+crawl_pets = registry.counter(
+    "crawler_crawl_pets_total", "크롤링으로 얻은 Pet 수", ("shop",))
+image_requests = registry.counter(
+    "crawler_image_requests_total", "이미지 대기열 처리 결과 (stored/failed/dropped)", ("result",))
+cache_requests = registry.counter(
+    "crawler_cache_requests_total", "결과 캐시 조회 수 (fresh/stale/miss)", ("shop", "result"))
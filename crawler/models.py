@@ -6,6 +6,18 @@ from typing import List, Optional
 from datetime import datetime
 
 
+class PetAlternate(BaseModel):
+    """
+    다른 샵에 올라온 같은 동물 (중복 제거 시 대표 Pet에 포함)
+    """
+    id: str
+    shop: str
+    shopId: str
+    shopUrl: str
+    price: int
+    detailUrl: str = ""
+
+
 class Pet(BaseModel):
     id: str
     name: str
@@ -23,6 +35,11 @@ class Pet(BaseModel):
     vaccinated: bool = False
     registered: bool = False
     crawledAt: str
+    detailUrl: str = ""
+    # 로컬 썸네일 주소 (이미지 캐시를 켠 경우, 예: /api/images/{key})
+    thumbnail: str = ""
+    # 다른 샵의 같은 동물 (/api/crawl?dedupe=true일 때 대표 Pet에만 채워짐)
+    alternates: List[PetAlternate] = []
 
 
 class CrawlResult(BaseModel):
@@ -32,6 +49,10 @@ class CrawlResult(BaseModel):
     pets: List[Pet]
     count: int
     error: Optional[str] = None
+    # 마감 시간 안에 끝나지 않아 그때까지 파싱한 Pet만 담은 결과
+    partial: bool = False
+    # 이 결과에 반영된 샵의 마지막 변경 버전 (/api/changes?since=)
+    version: int = 0
 
 
 class CrawlRequest(BaseModel):
@@ -44,3 +65,7 @@ class CrawlResponse(BaseModel):
     results: List[CrawlResult]
     failed: List[dict] = []
     total: int = 0
+    # dedupe=true일 때 대표 Pet으로 묶여 빠진 중복 Pet 수
+    duplicates: int = 0
+    # 응답에 반영된 마지막 변경 버전 (이후 변경은 /api/changes?since=version으로 조회)
+    version: int = 0
@@ -0,0 +1,167 @@
+"""
+필드 정규화 모듈
+정규식은 모듈 로드 시 한 번만 컴파일하고,
+크롤러가 만든 원시 레코드(raw record) 목록을 한 번에 정규화하는 배치 API 제공
+"""
+import re
+from typing import List
+from urllib.parse import urljoin
+
+# 미리 컴파일한 패턴
+WHITESPACE_RE = re.compile(r"\s+")
+NON_DIGIT_RE = re.compile(r"[^0-9]")
+AGE_RE = re.compile(r"(\d+)\s*(주|개월|년|세|일|week|month|year|old|age)", re.IGNORECASE)
+ONCLICK_URL_RES = (
+    # location.href='...'
+    re.compile(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]"),
+    # window.open('...')
+    re.compile(r"window\.open\s*\(\s*['\"]([^'\"]+)['\"]"),
+)
+BACKGROUND_URL_RES = (
+    re.compile(r"background-image\s*:\s*url\s*\(\s*['\"]?([^)'\"]+)['\"]?\s*\)", re.IGNORECASE),
+    re.compile(r"background\s*:\s*url\s*\(\s*['\"]?([^)'\"]+)['\"]?\s*\)", re.IGNORECASE),
+)
+FEMALE_KEYWORDS = ("암컷", "암", "여", "female", "f")
+
+
+def clean_text(text: str) -> str:
+    """
+    텍스트 정리 (공백 제거, 줄바꿈 정리)
+    """
+    if not text:
+        return ""
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def extract_price(text: str) -> int:
+    """
+    텍스트에서 가격 숫자 추출
+    """
+    if not text:
+        return 0
+    numbers = NON_DIGIT_RE.sub("", text)
+    return int(numbers) if numbers else 0
+
+
+def extract_age(text: str) -> str:
+    """
+    텍스트에서 나이 정보 추출
+    """
+    if not text:
+        return "나이 미상"
+    match = AGE_RE.search(text)
+    if match:
+        return match.group(0).strip()
+    return text.strip() or "나이 미상"
+
+
+def extract_gender(text: str) -> str:
+    """
+    텍스트에서 성별 추출
+    """
+    if not text:
+        return "수컷"
+    text_lower = text.lower()
+    if any(keyword in text_lower for keyword in FEMALE_KEYWORDS):
+        return "암컷"
+    return "수컷"
+
+
+def extract_onclick_url(onclick_attr: str) -> str:
+    """
+    onclick 속성에서 URL 추출
+    예: onclick="location.href='view.php?id=123'" -> "view.php?id=123"
+    """
+    if not onclick_attr:
+        return ""
+    for pattern in ONCLICK_URL_RES:
+        match = pattern.search(onclick_attr)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def extract_background_image_url(style_attr: str) -> str:
+    """
+    style 속성에서 배경 이미지 URL 추출
+    예: style="background-image:url('image.jpg')" -> "image.jpg"
+    """
+    if not style_attr:
+        return ""
+    for pattern in BACKGROUND_URL_RES:
+        match = pattern.search(style_attr)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def make_absolute_url(url: str, base_url: str) -> str:
+    """
+    상대 URL을 절대 URL로 변환
+    """
+    if not url:
+        return ""
+    if url.startswith(("http://", "https://")):
+        return url
+    return urljoin(base_url, url)
+
+
+def normalize_records(records: List[dict], spec) -> List[dict]:
+    """
+    원시 레코드 목록을 한 번에 정규화
+    원시 레코드: index와 추출기가 반환한 원시 문자열(없으면 None)
+      - link, image: 상대/절대 URL
+      - name, breed, price, description: 요소 텍스트 (공백 정리 전)
+      - age, gender, location, type: 샵 훅이 채운 텍스트 (없으면 spec의 기본값)
+    spec: base_url, breed(None이면 이름의 첫 단어를 품종으로), empty_name, default_* 속성을 가진 명세
+    """
+    # 반복문 안에서 속성 조회를 줄이기 위해 지역 변수로 바인딩
+    ws_sub = WHITESPACE_RE.sub
+    digit_sub = NON_DIGIT_RE.sub
+    base_url = spec.base_url
+    derive_breed = spec.breed is None
+    empty_name = spec.empty_name
+    default_age = spec.default_age
+    default_gender = spec.default_gender
+    default_location = spec.default_location
+    default_type = spec.default_type
+
+    normalized = []
+    append = normalized.append
+    for raw in records:
+        number = raw["index"] + 1
+
+        name = raw.get("name")
+        name = f"이름 없음 {number}" if name is None else ws_sub(" ", name).strip()
+
+        if derive_breed:
+            breed = name.split()[0] if " " in name else "품종 미상"
+        else:
+            breed = raw.get("breed")
+            breed = "품종 미상" if breed is None else ws_sub(" ", breed).strip()
+
+        if not name and empty_name:
+            name = empty_name.format(breed=breed, number=number)
+
+        price_text = raw.get("price")
+        digits = digit_sub("", price_text) if price_text else ""
+
+        age = raw.get("age")
+        gender = raw.get("gender")
+        location = raw.get("location")
+        description = raw.get("description")
+
+        append({
+            "index": raw["index"],
+            "detail_url": make_absolute_url(raw.get("link") or "", base_url),
+            "name": name,
+            "breed": breed,
+            "age": extract_age(age) if age else default_age,
+            "gender": extract_gender(gender) if gender else default_gender,
+            "price": int(digits) if digits else 0,
+            "location": ws_sub(" ", location).strip() if location else default_location,
+            "image": make_absolute_url(raw.get("image") or "", base_url),
+            "type": raw.get("type") or default_type,
+            "description": ws_sub(" ", description).strip() if description else "",
+        })
+    return normalized
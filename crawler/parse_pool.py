@@ -0,0 +1,140 @@
+"""
+목록 페이지 파싱 프로세스 풀
+BeautifulSoup 파싱과 정규화는 CPU 작업이라 이벤트 루프 프로세스 하나에서는 GIL 때문에 동시에 한 페이지씩만 처리됨
+CRAWLER_PARSE_WORKERS > 0이면 가져온 페이지의 원본 바이트를 파싱 프로세스로 보내고,
+각 프로세스는 샵 ID로 레지스트리에서 명세를 찾아 파싱한 뒤 간결한 레코드(튜플)만 돌려줌 (Pet 생성은 부모 프로세스)
+- 상세 페이지(enrich.py)도 같은 풀에서 파싱하여 필드 dict만 돌려줌
+- 0 (기본): 이벤트 루프에서 바로 파싱 (상세 페이지는 기본 스레드 풀)
+- 프로세스는 spawn으로 시작 (이벤트 루프/스레드/SQLite 연결을 복제하지 않음)
+- 풀이 비정상 종료되면 다시 만들고, 그 페이지는 부모 프로세스에서 파싱 (다른 파싱 프로세스 오류도 부모 프로세스에서 다시 파싱)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PARSE_WORKERS = int(os.getenv("CRAWLER_PARSE_WORKERS", "0"))
+
+# (레코드 리스트, 페이지네이션 링크, 실패한 아이템 수, 파싱 시간)
+ParsedPage = Tuple[List[tuple], List[str], int, float]
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+# 파싱 프로세스 안의 레지스트리 (프로세스마다 한 번 생성, 모듈은 처음 파싱할 때 import)
+_registry = None
+
+
+def enabled() -> bool:
+    return PARSE_WORKERS > 0
+
+
+def _init_worker():
+    """
+    파싱 프로세스 초기화 (엔진과 레지스트리를 미리 import)
+    """
+    global _registry
+    import engine  # noqa: F401
+    from registry import default_registry
+    _registry = default_registry()
+
+
+def _parse_in_worker(shop_id: str, content: bytes, encoding: str,
+                     page_url: str) -> Optional[ParsedPage]:
+    """
+    파싱 프로세스에서 실행 (레지스트리에 없거나 SPEC이 없는 샵이면 None -> 부모 프로세스에서 파싱)
+    """
+    import engine
+    from fetcher import decode_content
+
+    if _registry is None or shop_id not in _registry:
+        return None
+    spec = getattr(_registry.module(shop_id), "SPEC", None)
+    if spec is None:
+        return None
+    start = time.perf_counter()
+    records, page_urls, failures = engine.parse_page_records(
+        spec, decode_content(content, encoding), page_url)
+    return records, page_urls, failures, time.perf_counter() - start
+
+
+def _parse_detail_in_worker(shop_id: str, content: bytes, encoding: str) -> Optional[Dict[str, object]]:
+    """
+    파싱 프로세스에서 상세 페이지 파싱 (상세 명세가 없으면 None -> 부모 프로세스에서 파싱)
+    """
+    from fetcher import decode_content
+
+    if _registry is None or shop_id not in _registry:
+        return None
+    spec = getattr(_registry.module(shop_id), "SPEC", None)
+    if spec is None or spec.detail is None:
+        return None
+    return spec.detail.parse(decode_content(content, encoding))
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def start(workers: int = PARSE_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """
+    프로세스 풀 생성 (이미 있으면 그대로 사용)
+    """
+    global _pool
+    if _pool is None and workers > 0:
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        # 첫 크롤링이 프로세스 시작을 기다리지 않도록 미리 띄움
+        for _ in range(workers):
+            _pool.submit(_warm_up)
+    return _pool
+
+
+def stop():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def _run(func, shop_id: str, page_url: str, *args):
+    """
+    파싱 프로세스에서 func 실행 (풀이 없거나 오류가 나면 None -> 호출 측에서 직접 파싱)
+    """
+    pool = start()
+    if pool is None:
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool as e:
+        logger.warning("파싱 프로세스 풀 오류, 다시 생성합니다: %s", e)
+        if _pool is pool:
+            stop()
+        return None
+    except Exception as e:
+        logger.warning("파싱 프로세스 오류 (%s, %s), 직접 파싱합니다: %r", shop_id, page_url, e)
+        return None
+
+
+async def parse(shop_id: str, content: bytes, encoding: str, page_url: str) -> Optional[ParsedPage]:
+    """
+    파싱 프로세스에서 목록 페이지 파싱 (None이면 호출 측에서 직접 파싱)
+    """
+    return await _run(_parse_in_worker, shop_id, page_url, shop_id, content, encoding, page_url)
+
+
+async def parse_detail(shop_id: str, content: bytes, encoding: str,
+                       page_url: str) -> Optional[Dict[str, object]]:
+    """
+    파싱 프로세스에서 상세 페이지 파싱 (None이면 호출 측에서 직접 파싱)
+    """
+    return await _run(_parse_detail_in_worker, shop_id, page_url, shop_id, content, encoding)
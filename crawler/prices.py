@@ -0,0 +1,300 @@
+"""
+가격 이력 (열 단위 배열 저장 + 벡터 집계)
+샵 결과를 저장할 때마다 (Pet ID, 시각, 가격) 관측값을 SQLite에 추가하고, 메모리에는 numpy 배열로 보관
+- 관측값 배열: 시각(float64), 가격(int64), Pet 코드(int32) - 관측값마다 객체를 만들지 않음
+- Pet별 속성(샵, 품종, 타입)은 Pet 코드로 찾는 코드 배열로 보관
+- 같은 가격은 CRAWLER_PRICE_SAMPLE_INTERVAL (초)마다 한 번만 기록 (가격이 바뀌면 바로 기록)
+- 집계: 기간 안에서 Pet별 마지막 가격을 골라 그룹(품종/타입/샵)별 개수, 최소/최대/평균, 백분위수를 정렬된 배열에서 한 번에 계산
+- 관측값은 항상 시각 순으로 추가되므로 배열 위치가 뒤일수록 최신
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from models import Pet
+
+PRICES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_history (
+    pet_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    price INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_price_history_ts ON price_history (ts);
+CREATE INDEX IF NOT EXISTS idx_price_history_pet ON price_history (pet_id, ts);
+"""
+
+# 같은 가격을 다시 기록하기까지의 최소 간격 (초)
+SAMPLE_INTERVAL = float(os.getenv("CRAWLER_PRICE_SAMPLE_INTERVAL", "3600"))
+# 보관 기간 (일, 시작 시 오래된 관측값 삭제)
+RETENTION_DAYS = float(os.getenv("CRAWLER_PRICE_RETENTION_DAYS", "365"))
+
+# 집계 그룹 -> Pet 속성
+GROUP_FIELDS = {"breed": "breed", "type": "type", "shopId": "shop_id"}
+DEFAULT_PERCENTILES = (25.0, 50.0, 75.0)
+
+
+class Categories:
+    """
+    문자열 <-> 정수 코드
+    """
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def code(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class GrowableArray:
+    """
+    용량을 두 배씩 늘리는 1차원 numpy 배열
+    """
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, values: np.ndarray):
+        end = self.size + len(values)
+        if end > len(self.data):
+            grown = np.empty(max(end, len(self.data) * 2), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end] = values
+        self.size = end
+
+    def set(self, index: int, value):
+        if index >= self.size:
+            self.append(np.zeros(index + 1 - self.size, dtype=self.data.dtype))
+        self.data[index] = value
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.data[:self.size]
+
+
+class PendingPrices(NamedTuple):
+    """
+    트랜잭션이 커밋되면 배열에 추가할 관측값
+    """
+    codes: np.ndarray
+    ts: np.ndarray
+    prices: np.ndarray
+
+
+class PriceHistory:
+    """
+    가격 관측값 저장소 (PetStore의 연결과 트랜잭션 안에서 기록, 집계는 메모리 배열로)
+    """
+
+    def __init__(self, sample_interval: float = SAMPLE_INTERVAL, retention_days: float = RETENTION_DAYS):
+        self.sample_interval = sample_interval
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        # 관측값 열
+        self.ts = GrowableArray(np.float64)
+        self.price = GrowableArray(np.int64)
+        self.pet = GrowableArray(np.int32)
+        # Pet 코드별 속성 코드와 마지막 관측값
+        self.pets = Categories()
+        self.categories = {field: Categories() for field in GROUP_FIELDS.values()}
+        self.attributes = {field: GrowableArray(np.int32) for field in GROUP_FIELDS.values()}
+        self._last_ts: List[float] = []
+        self._last_price: List[int] = []
+
+    def __len__(self) -> int:
+        return self.ts.size
+
+    def load(self, conn: sqlite3.Connection):
+        """
+        보관 기간이 지난 관측값을 삭제하고 나머지를 배열로 불러오기
+        """
+        cutoff = time.time() - self.retention_days * 86400
+        with conn:
+            conn.execute("DELETE FROM price_history WHERE ts < ?", (cutoff,))
+        pets = conn.execute("SELECT id, shop_id, breed, type FROM pets").fetchall()
+        rows = conn.execute("SELECT pet_id, ts, price FROM price_history ORDER BY ts, rowid").fetchall()
+        with self._lock:
+            self._reset()
+            for pet_id, shop_id, breed, pet_type in pets:
+                self._register(pet_id, shop_id, breed, pet_type)
+            if rows:
+                codes = np.fromiter((self._register(row[0]) for row in rows), dtype=np.int32, count=len(rows))
+                ts = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+                prices = np.fromiter((row[2] for row in rows), dtype=np.int64, count=len(rows))
+                self._append(codes, ts, prices)
+
+    def _register(self, pet_id: str, shop_id: Optional[str] = None,
+                  breed: Optional[str] = None, pet_type: Optional[str] = None) -> int:
+        """
+        Pet 코드 (속성이 주어지면 갱신)
+        """
+        code = self.pets.code(pet_id)
+        if code == len(self._last_ts):
+            self._last_ts.append(float("-inf"))
+            self._last_price.append(-1)
+            for field in GROUP_FIELDS.values():
+                self.attributes[field].set(code, self.categories[field].code(""))
+        for field, value in (("shop_id", shop_id), ("breed", breed), ("type", pet_type)):
+            if value is not None:
+                self.attributes[field].set(code, self.categories[field].code(value))
+        return code
+
+    def _append(self, codes: np.ndarray, ts: np.ndarray, prices: np.ndarray):
+        self.pet.append(codes)
+        self.ts.append(ts)
+        self.price.append(prices)
+        for code, t, price in zip(codes.tolist(), ts.tolist(), prices.tolist()):
+            self._last_ts[code] = t
+            self._last_price[code] = price
+
+    def record(self, conn: sqlite3.Connection, pets: Sequence[Pet],
+               now: Optional[float] = None) -> Optional[PendingPrices]:
+        """
+        크롤링 결과의 가격 관측값을 SQLite에 추가 (가격 정보가 없는 Pet은 제외)
+        배열에는 추가하지 않음 - 호출 측이 트랜잭션을 커밋한 뒤 반환값을 apply에 넘김
+        반환: 배열에 추가할 관측값 (없으면 None)
+        """
+        with self._lock:
+            # 시각 순서를 지키도록 잠금 안에서 시각 결정
+            now = time.time() if now is None else now
+            codes, prices, rows = [], [], []
+            for pet in pets:
+                if pet.price <= 0:
+                    continue
+                code = self._register(pet.id, pet.shopId, pet.breed, pet.type)
+                if (self._last_price[code] == pet.price
+                        and now - self._last_ts[code] < self.sample_interval):
+                    continue
+                codes.append(code)
+                prices.append(pet.price)
+                rows.append((pet.id, now, pet.price))
+            if not rows:
+                return None
+            conn.executemany("INSERT INTO price_history (pet_id, ts, price) VALUES (?, ?, ?)", rows)
+            return PendingPrices(
+                np.array(codes, dtype=np.int32),
+                np.full(len(codes), now, dtype=np.float64),
+                np.array(prices, dtype=np.int64),
+            )
+
+    def apply(self, pending: Optional[PendingPrices]):
+        """
+        커밋된 record 결과를 배열에 추가
+        """
+        if pending is None:
+            return
+        with self._lock:
+            self._append(pending.codes, pending.ts, pending.prices)
+
+    def history(self, pet_id: str) -> List[dict]:
+        """
+        Pet 하나의 가격 이력
+        """
+        with self._lock:
+            code = self.pets.codes.get(pet_id)
+            if code is None:
+                return []
+            index = np.flatnonzero(self.pet.values == code)
+            ts = self.ts.values[index]
+            prices = self.price.values[index]
+        return [
+            {"at": datetime.fromtimestamp(t).isoformat(), "price": int(price)}
+            for t, price in zip(ts.tolist(), prices.tolist())
+        ]
+
+    def stats(self, group_by: str = "breed", days: float = 30.0,
+              percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+              filters: Optional[Dict[str, Optional[str]]] = None,
+              now: Optional[float] = None) -> dict:
+        """
+        기간(최근 days일) 안의 그룹별 가격 통계
+        Pet마다 기간 안의 마지막 가격 하나만 사용 (자주 관측된 Pet에 치우치지 않도록)
+        filters: {"breed" | "type" | "shopId": 값}
+        """
+        if group_by not in GROUP_FIELDS:
+            raise ValueError(f"Invalid groupBy: {group_by}")
+        for q in percentiles:
+            if not 0 <= q <= 100:
+                raise ValueError(f"Invalid percentile: {q}")
+        now = time.time() if now is None else now
+        # 아주 큰 days(inf 포함)는 처음부터로 처리 (음수 시각은 datetime으로 바꿀 수 없음)
+        start = max(now - days * 86400, 0.0)
+
+        with self._lock:
+            ts = self.ts.values
+            in_window = np.flatnonzero((ts >= start) & (ts <= now))
+            # Pet별 마지막 관측값 = 기간 안에서 가장 뒤의 위치
+            latest = np.full(len(self.pets.names), -1, dtype=np.int64)
+            np.maximum.at(latest, self.pet.values[in_window], in_window)
+            latest = latest[latest >= 0]
+            codes = self.pet.values[latest]
+            prices = self.price.values[latest]
+
+            keep = np.ones(len(codes), dtype=bool)
+            for name, value in (filters or {}).items():
+                if value is None:
+                    continue
+                field = GROUP_FIELDS[name]
+                category = self.categories[field].codes.get(value)
+                if category is None:
+                    keep[:] = False
+                    break
+                keep &= self.attributes[field].values[codes] == category
+            codes = codes[keep]
+            prices = prices[keep]
+
+            field = GROUP_FIELDS[group_by]
+            keys = self.attributes[field].values[codes]
+            names = list(self.categories[field].names)
+
+        groups = []
+        if len(keys):
+            # 그룹, 가격 순으로 정렬하면 그룹마다 정렬된 구간이 되어 백분위수를 위치로 바로 계산 가능
+            order = np.lexsort((prices, keys))
+            keys = keys[order]
+            values = prices[order].astype(np.float64)
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            counts = np.diff(np.r_[starts, len(keys)])
+            means = np.add.reduceat(values, starts) / counts
+            # 선형 보간 백분위수 (numpy.percentile 기본 방식과 같음)
+            quantiles = {}
+            for q in percentiles:
+                position = starts + (counts - 1) * (q / 100.0)
+                low = np.floor(position).astype(np.int64)
+                high = np.ceil(position).astype(np.int64)
+                quantiles[q] = values[low] + (values[high] - values[low]) * (position - low)
+            for i, (key, count) in enumerate(zip(keys[starts].tolist(), counts.tolist())):
+                group = {
+                    "key": names[key],
+                    "count": count,
+                    "min": int(values[starts[i]]),
+                    "max": int(values[starts[i] + count - 1]),
+                    "mean": round(float(means[i])),
+                }
+                for q, column in quantiles.items():
+                    group[f"p{q:g}"] = round(float(column[i]))
+                groups.append(group)
+            groups.sort(key=lambda group: (-group["count"], group["key"]))
+
+        return {
+            "groupBy": group_by,
+            "from": datetime.fromtimestamp(start).isoformat(),
+            "to": datetime.fromtimestamp(now).isoformat(),
+            "percentiles": list(percentiles),
+            "total": int(len(keys)),
+            "groups": groups,
+        }
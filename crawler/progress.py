@@ -0,0 +1,90 @@
+"""
+크롤링 진행 상황과 마감 시간 (협조적 취소)
+크롤링 중인 샵마다 CrawlProgress 하나를 두고, 현재 크롤링 작업의 컨텍스트 변수로 전달
+- 엔진은 페이지를 파싱할 때마다 지금까지의 Pet 목록을 publish (마감 시 부분 결과로 사용)
+- fetcher와 엔진은 체크포인트에서 마감 시간을 확인하고, 지났으면 CrawlCancelled로 중단
+- 요청 타임아웃은 남은 시간으로 줄여서, 응답이 없는 사이트도 마감 시간을 넘기지 않음
+"""
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+
+class CrawlCancelled(Exception):
+    """
+    마감 시간이 지나 크롤링을 중단함
+    """
+
+
+class CrawlProgress:
+    """
+    크롤링 하나의 진행 상황
+    deadline: time.monotonic() 기준 마감 시각 (None이면 제한 없음)
+    """
+
+    def __init__(self, deadline: Optional[float] = None):
+        self.deadline = deadline
+        self.pets: List = []
+        self.pages = 0
+
+    def extend(self, deadline: Optional[float]):
+        """
+        같은 크롤링을 기다리는 다른 요청의 마감 시각 반영 (가장 늦은 마감 시각, 하나라도 제한이 없으면 제한 없음)
+        """
+        if self.deadline is None:
+            return
+        self.deadline = None if deadline is None else max(self.deadline, deadline)
+
+    def publish(self, pets: List, pages: Optional[int] = None):
+        """
+        지금까지 파싱한 Pet 목록 기록
+        """
+        self.pets = list(pets)
+        if pages is not None:
+            self.pages = pages
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def checkpoint(self):
+        if self.expired:
+            raise CrawlCancelled("Deadline exceeded")
+
+    def time_budget(self, timeout: float) -> float:
+        """
+        요청 타임아웃을 남은 시간으로 제한 (이미 지났으면 CrawlCancelled)
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise CrawlCancelled("Deadline exceeded")
+        return min(timeout, remaining)
+
+
+# 현재 크롤링 작업의 진행 상황 (크롤링 밖에서는 None)
+current_progress: ContextVar[Optional[CrawlProgress]] = ContextVar("current_progress", default=None)
+
+
+def publish(pets: List, pages: Optional[int] = None):
+    progress = current_progress.get()
+    if progress is not None:
+        progress.publish(pets, pages)
+
+
+def checkpoint():
+    progress = current_progress.get()
+    if progress is not None:
+        progress.checkpoint()
+
+
+def time_budget(timeout: float) -> float:
+    progress = current_progress.get()
+    return progress.time_budget(timeout) if progress is not None else timeout
@@ -0,0 +1,133 @@
+"""
+백그라운드 주기 크롤러
+샵마다 독립된 주기로 다시 크롤링하며, 목록이 실제로 바뀌는 빈도에 따라 주기를 조정
+- 변경 있음: 주기를 줄임 (speedup 배)
+- 변경 없음/실패: 주기를 늘림 (backoff 배)
+"""
+import asyncio
+import hashlib
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+def result_signature(result) -> str:
+    """
+    크롤링 결과의 변경 감지용 서명 (ID, 가격, 이름 기준)
+    """
+    digest = hashlib.sha1()
+    for pet in sorted(result.pets, key=lambda p: p.id):
+        digest.update(f"{pet.id}|{pet.price}|{pet.name}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ShopRefreshState:
+    """
+    샵별 갱신 상태
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.signature: Optional[str] = None
+        self.last_run: Optional[float] = None
+        self.last_change: Optional[float] = None
+        self.next_run: Optional[float] = None
+        self.runs = 0
+        self.changes = 0
+
+
+class AdaptiveRefresher:
+    """
+    샵별 적응형 주기 갱신기
+    refresh: 샵 ID를 받아 CrawlResult를 반환하는 코루틴 함수 (캐시를 거치지 않는 크롤링)
+    """
+
+    def __init__(
+        self,
+        shop_ids: List[str],
+        refresh: Callable[[str], Awaitable],
+        initial_interval: float = 300.0,
+        min_interval: float = 60.0,
+        max_interval: float = 3600.0,
+        speedup: float = 0.5,
+        backoff: float = 1.5,
+    ):
+        self.refresh = refresh
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.backoff = backoff
+        self.states: Dict[str, ShopRefreshState] = {
+            shop_id: ShopRefreshState(initial_interval) for shop_id in shop_ids
+        }
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run_shop(shop_id)) for shop_id in self.states
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _clamp(self, interval: float) -> float:
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def record(self, shop_id: str, result):
+        """
+        크롤링 결과를 반영하여 다음 주기 조정
+        """
+        state = self.states[shop_id]
+        now = time.time()
+        state.last_run = now
+        state.runs += 1
+        if not result.success:
+            state.interval = self._clamp(state.interval * self.backoff)
+            return
+        signature = result_signature(result)
+        if state.signature is not None and signature != state.signature:
+            state.changes += 1
+            state.last_change = now
+            state.interval = self._clamp(state.interval * self.speedup)
+        elif state.signature is not None:
+            state.interval = self._clamp(state.interval * self.backoff)
+        state.signature = signature
+
+    async def _run_shop(self, shop_id: str):
+        state = self.states[shop_id]
+        # 시작 시 모든 샵이 한꺼번에 요청하지 않도록 첫 실행을 분산
+        delay = random.uniform(0, min(state.interval, self.min_interval))
+        while True:
+            state.next_run = time.time() + delay
+            await asyncio.sleep(delay)
+            try:
+                result = await self.refresh(shop_id)
+                self.record(shop_id, result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"{shop_id} 백그라운드 갱신 오류: {e}")
+                state.interval = self._clamp(state.interval * self.backoff)
+            # 같은 시각에 몰리지 않도록 약간의 지터 추가
+            delay = state.interval * random.uniform(0.9, 1.1)
+
+    def status(self) -> Dict[str, dict]:
+        """
+        샵별 갱신 주기와 실행 이력
+        """
+        return {
+            shop_id: {
+                "interval": round(state.interval, 1),
+                "runs": state.runs,
+                "changes": state.changes,
+                "lastRun": state.last_run,
+                "lastChange": state.last_change,
+                "nextRun": state.next_run,
+            }
+            for shop_id, state in self.states.items()
+        }
@@ -0,0 +1,124 @@
+"""
+크롤러 레지스트리
+샵 목록은 메타데이터(기본 크롤러 목록 + 엔트리 포인트)로 만들고,
+각 크롤러 모듈은 해당 샵을 처음 크롤링할 때 import
+"""
+import importlib
+import os
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+# 외부 패키지가 크롤러를 등록하는 엔트리 포인트 그룹
+# 예 (pyproject.toml):
+#   [project.entry-points."pet_crawler.shops"]
+#   myshop = "myshop_crawler:crawl_myshop"
+ENTRY_POINT_GROUP = "pet_crawler.shops"
+
+# 일부 샵만 크롤링하는 워커용 (쉼표로 구분한 샵 ID, 비어 있으면 전체)
+ENABLED_SHOPS = [s.strip() for s in os.getenv("CRAWLER_SHOPS", "").split(",") if s.strip()]
+
+
+@dataclass
+class CrawlerEntry:
+    """
+    등록된 크롤러 하나
+    - target: "모듈:함수" 형식의 크롤링 함수 경로
+    - base_url: 스케줄러의 호스트 구분에 사용 (없으면 모듈을 import한 뒤 BASE_URL에서 읽음)
+    """
+    shop_id: str
+    target: str
+    base_url: str = ""
+    _func: Optional[Callable] = field(default=None, init=False, repr=False)
+
+    @property
+    def module_name(self) -> str:
+        return self.target.partition(":")[0]
+
+    def load(self) -> Callable:
+        """
+        크롤러 모듈을 import하여 크롤링 함수 반환 (처음 한 번만 import)
+        """
+        if self._func is None:
+            module_name, _, attr = self.target.partition(":")
+            module = importlib.import_module(module_name)
+            self._func = getattr(module, attr)
+            if not self.base_url:
+                self.base_url = getattr(module, "BASE_URL", "")
+        return self._func
+
+
+class CrawlerRegistry:
+    """
+    샵 ID -> 크롤러 매핑 (등록 순서 유지, 크롤링 함수는 지연 로딩)
+    """
+
+    def __init__(self, enabled: Optional[List[str]] = None):
+        self._entries: Dict[str, CrawlerEntry] = {}
+        self.enabled = set(enabled) if enabled else None
+
+    def register(self, shop_id: str, target: str, base_url: str = ""):
+        """
+        크롤러 등록 (같은 샵 ID는 나중 등록이 덮어씀, enabled에 없는 샵은 무시)
+        """
+        if self.enabled is not None and shop_id not in self.enabled:
+            return
+        self._entries[shop_id] = CrawlerEntry(shop_id, target, base_url)
+
+    def register_builtin(self, manifest):
+        """
+        (샵 ID, "모듈:함수", BASE_URL) 목록으로 기본 크롤러 등록
+        """
+        for shop_id, target, base_url in manifest:
+            self.register(shop_id, target, base_url)
+
+    def discover(self, group: str = ENTRY_POINT_GROUP):
+        """
+        설치된 패키지의 엔트리 포인트에서 크롤러 등록 (엔트리 포인트 이름이 샵 ID)
+        """
+        for ep in entry_points(group=group):
+            self.register(ep.name, ep.value)
+
+    def __contains__(self, shop_id: str) -> bool:
+        return shop_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, shop_id: str) -> Callable:
+        """
+        샵의 크롤링 함수 (등록되지 않은 샵이면 KeyError)
+        """
+        return self._entries[shop_id].load()
+
+    def module(self, shop_id: str):
+        """
+        샵의 크롤러 모듈 (SPEC 등 모듈 속성 조회용)
+        """
+        self.get(shop_id)
+        return importlib.import_module(self._entries[shop_id].module_name)
+
+    def host(self, shop_id: str) -> str:
+        """
+        샵의 호스트 이름 (메타데이터에 BASE_URL이 없으면 모듈을 import하여 확인)
+        """
+        entry = self._entries[shop_id]
+        if not entry.base_url:
+            entry.load()
+        return urlparse(entry.base_url).netloc or entry.module_name
+
+
+def default_registry() -> CrawlerRegistry:
+    """
+    기본 크롤러와 엔트리 포인트 플러그인을 등록한 레지스트리 (CRAWLER_SHOPS로 범위 제한)
+    """
+    from crawlers import BUILTIN_CRAWLERS
+
+    registry = CrawlerRegistry(ENABLED_SHOPS)
+    registry.register_builtin(BUILTIN_CRAWLERS)
+    registry.discover()
+    return registry
@@ -0,0 +1,123 @@
+"""
+크롤링 작업 스케줄러
+앱 수명 주기 동안 하나의 인스턴스를 사용하며
+전역/호스트별 동시 실행 제한, 대기열, 샵 간 공정한(라운드 로빈) 순서를 보장
+"""
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+
+class CrawlJob:
+    """
+    대기열에 들어가는 단일 크롤링 작업
+    """
+
+    def __init__(self, key: str, host: str, factory: Callable[[], Awaitable[Any]], future: asyncio.Future):
+        self.key = key
+        self.host = host
+        self.factory = factory
+        self.future = future
+
+
+class CrawlScheduler:
+    """
+    고정된 워커 수로 크롤링 작업을 실행하는 스케줄러
+    - max_concurrency: 전역 동시 실행 수 (워커 수)
+    - per_host_limit: 같은 호스트에 대한 동시 실행 수
+    - 같은 key의 작업이 이미 대기/실행 중이면 새로 만들지 않고 결과를 공유
+    """
+
+    def __init__(self, max_concurrency: int = 10, per_host_limit: int = 1):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        # key별 대기열 (삽입 순서가 라운드 로빈 순서)
+        self._queues: "OrderedDict[str, Deque[CrawlJob]]" = OrderedDict()
+        self._host_active: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._cond: Optional[asyncio.Condition] = None
+        self._workers = []
+
+    async def start(self):
+        """
+        워커 시작 (앱 시작 시 호출)
+        """
+        if self._workers:
+            return
+        self._cond = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)
+        ]
+
+    async def stop(self):
+        """
+        워커 종료 및 대기 중인 작업 취소 (앱 종료 시 호출)
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for queue in self._queues.values():
+            for job in queue:
+                if not job.future.done():
+                    job.future.cancel()
+        self._queues.clear()
+        self._host_active.clear()
+        self._inflight.clear()
+
+    async def submit(self, key: str, host: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        작업을 대기열에 넣고 결과를 기다림
+        factory는 호출 시 새 코루틴을 반환해야 함
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            future.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+            job = CrawlJob(key, host, factory, future)
+            async with self._cond:
+                self._queues.setdefault(key, deque()).append(job)
+                self._cond.notify()
+        # 요청이 취소되어도 공유 작업은 계속 진행
+        return await asyncio.shield(future)
+
+    def _next_job(self) -> Optional[CrawlJob]:
+        """
+        호스트 제한에 걸리지 않는 첫 번째 key의 작업을 꺼냄 (라운드 로빈)
+        """
+        for key, queue in self._queues.items():
+            job = queue[0]
+            if self._host_active.get(job.host, 0) >= self.per_host_limit:
+                continue
+            queue.popleft()
+            del self._queues[key]
+            if queue:
+                # 남은 작업이 있으면 맨 뒤로 보내 다른 샵에 차례를 넘김
+                self._queues[key] = queue
+            return job
+        return None
+
+    async def _worker(self):
+        while True:
+            async with self._cond:
+                job = self._next_job()
+                while job is None:
+                    await self._cond.wait()
+                    job = self._next_job()
+                self._host_active[job.host] = self._host_active.get(job.host, 0) + 1
+            try:
+                result = await job.factory()
+                if not job.future.done():
+                    job.future.set_result(result)
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.cancel()
+                raise
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                async with self._cond:
+                    self._host_active[job.host] -= 1
+                    self._cond.notify_all()
@@ -0,0 +1,137 @@
+"""
+응답 JSON 직렬화와 HTTP 캐시 검증
+FastAPI의 기본 경로(jsonable_encoder + json.dumps)를 거치지 않고 orjson으로 바이트를 만들어 그대로 응답
+- 샵별 CrawlResult는 객체 단위로 인코딩 결과를 기억하여, 캐시된 결과는 요청마다 다시 인코딩하지 않음
+- 전체 응답은 샵별 바이트를 이어 붙여 만듦
+- 응답 본문 해시로 약한 ETag를 만들고, If-None-Match가 같으면 본문 없이 304 응답
+  (gzip/비압축 응답이 같은 ETag를 쓰므로 강한 ETag는 쓸 수 없음)
+- 큰 응답은 gzip으로 압축 (스트리밍/이미지 경로 제외)
+"""
+import hashlib
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.middleware.gzip import GZipMiddleware
+
+from pydantic import BaseModel
+
+from models import CrawlResult
+
+# 압축하지 않는 경로 (NDJSON 스트림은 프레임을 바로 보내야 하고, 이미지는 이미 압축됨)
+NO_COMPRESS_PATHS = ("/api/crawl/stream", "/api/images/")
+
+
+def _default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    """
+    orjson 인코딩 (pydantic 모델 포함)
+    """
+    return orjson.dumps(obj, default=_default)
+
+
+class EncodedResults:
+    """
+    CrawlResult 객체 -> JSON 바이트 캐시
+    객체가 같을 때만 재사용하므로 새 크롤링 결과로 바뀌면 자동으로 다시 인코딩되고,
+    결과 객체가 사라지면 항목도 함께 삭제됨
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[weakref.ref, bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def encode(self, result: CrawlResult) -> bytes:
+        key = id(result)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is result:
+            return entry[1]
+        data = dumps(result)
+        self._entries[key] = (weakref.ref(result, lambda _, key=key: self._entries.pop(key, None)), data)
+        return data
+
+
+encoded_results = EncodedResults()
+
+
+def encode_result(result: CrawlResult) -> bytes:
+    return encoded_results.encode(result)
+
+
+def encode_crawl_response(results: List[CrawlResult], failed: List[dict],
+                          total: int, duplicates: int = 0, version: int = 0) -> bytes:
+    """
+    CrawlResponse와 같은 형식의 JSON 바이트 (샵별 결과는 캐시된 바이트를 이어 붙임)
+    """
+    return b"".join((
+        b'{"success":true,"results":[',
+        b",".join(encode_result(result) for result in results),
+        b'],"failed":',
+        dumps(failed),
+        b',"total":',
+        str(total).encode("ascii"),
+        b',"duplicates":',
+        str(duplicates).encode("ascii"),
+        b',"version":',
+        str(version).encode("ascii"),
+        b"}",
+    ))
+
+
+def make_etag(content: bytes) -> str:
+    """
+    응답 본문의 약한 ETag (압축 여부와 관계없이 같은 값)
+    """
+    return 'W/"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 (목록, "*" 허용, W/ 접두사는 무시하는 약한 비교)
+    """
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def json_response(content: bytes, request: Optional[Request] = None,
+                  status_code: int = 200) -> Response:
+    """
+    이미 인코딩한 JSON 바이트 응답
+    request를 주면 ETag를 붙이고, 클라이언트가 같은 ETag를 보냈으면 304 응답
+    """
+    if request is None:
+        return Response(content=content, status_code=status_code, media_type="application/json")
+    etag = make_etag(content)
+    # 캐시는 하되 매번 ETag로 다시 확인
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, status_code=status_code,
+                    media_type="application/json", headers=headers)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware에서 NO_COMPRESS_PATHS 경로만 제외
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(NO_COMPRESS_PATHS):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,186 @@
+"""
+Pet 영구 저장소 (SQLite)
+상세 URL에서 만든 안정적인 ID를 키로 사용하며, 크롤링마다 일괄 upsert
+같은 트랜잭션에서 이전 목록과 비교한 변경 이력(changes.py)과 가격 관측값(prices.py)을 기록
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from changes import CHANGES_SCHEMA, ChangeLog
+from models import Pet
+from prices import PRICES_SCHEMA, PriceHistory
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pets (
+    id TEXT PRIMARY KEY,
+    shop_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    breed TEXT NOT NULL,
+    age TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    location TEXT NOT NULL,
+    image TEXT NOT NULL,
+    shop TEXT NOT NULL,
+    shop_url TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    vaccinated INTEGER NOT NULL DEFAULT 0,
+    registered INTEGER NOT NULL DEFAULT 0,
+    detail_url TEXT NOT NULL DEFAULT '',
+    crawled_at TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_pets_shop ON pets (shop_id, active);
+CREATE INDEX IF NOT EXISTS idx_pets_type ON pets (type);
+CREATE INDEX IF NOT EXISTS idx_pets_breed ON pets (breed);
+CREATE INDEX IF NOT EXISTS idx_pets_price ON pets (price);
+"""
+
+UPSERT_SQL = """
+INSERT INTO pets (
+    id, shop_id, name, breed, age, gender, price, location, image, shop, shop_url,
+    type, description, vaccinated, registered, detail_url, crawled_at,
+    first_seen, last_seen, active
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name,
+    breed = excluded.breed,
+    age = excluded.age,
+    gender = excluded.gender,
+    price = excluded.price,
+    location = excluded.location,
+    image = excluded.image,
+    shop = excluded.shop,
+    shop_url = excluded.shop_url,
+    type = excluded.type,
+    description = excluded.description,
+    vaccinated = excluded.vaccinated,
+    registered = excluded.registered,
+    detail_url = excluded.detail_url,
+    crawled_at = excluded.crawled_at,
+    last_seen = excluded.last_seen,
+    active = 1
+"""
+
+SELECT_COLUMNS = (
+    "id, name, breed, age, gender, price, location, image, shop, shop_url, shop_id, "
+    "type, description, vaccinated, registered, crawled_at, detail_url"
+)
+
+
+class PetStore:
+    """
+    SQLite 기반 Pet 저장소
+    - sync_shop: 샵의 최신 크롤링 결과를 일괄 upsert하고, 이번에 보이지 않은 목록은 비활성화
+    - first_seen/last_seen으로 목록 이력을 유지
+    - changes: 크롤링 버전과 변경 이력
+    - prices: 가격 이력 (numpy 배열)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.changes = ChangeLog()
+        self.prices = PriceHistory()
+
+    def open(self):
+        if self._conn is not None:
+            return
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.executescript(CHANGES_SCHEMA)
+        self._conn.executescript(PRICES_SCHEMA)
+        self.changes.load(self._conn)
+        self.prices.load(self._conn)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.open()
+        return self._conn
+
+    def sync_shop(self, shop_id: str, pets: List[Pet]) -> int:
+        """
+        샵의 크롤링 결과를 하나의 트랜잭션으로 저장
+        반환: 이 샵의 마지막 변경 버전
+        빈 목록은 저장하지 않음 (목록을 찾지 못한 크롤링으로 샵 전체를 비활성화하고 삭제로 기록하지 않도록)
+        """
+        if not pets:
+            with self._lock:
+                return self.changes.shop_versions.get(shop_id, 0)
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                pet.id, pet.shopId, pet.name, pet.breed, pet.age, pet.gender, pet.price,
+                pet.location, pet.image, pet.shop, pet.shopUrl, pet.type, pet.description,
+                int(pet.vaccinated), int(pet.registered), pet.detailUrl, pet.crawledAt,
+                now, now,
+            )
+            for pet in pets
+        ]
+        with self._lock:
+            # 메모리 상태(버전, 가격 배열)는 트랜잭션이 커밋된 뒤에만 반영 (롤백되면 그대로)
+            with self.conn:
+                previous = {pet.id: pet for pet in self._select(shop_id)}
+                pending = self.changes.record(self.conn, shop_id, previous, pets)
+                prices = self.prices.record(self.conn, pets)
+                self.conn.executemany(UPSERT_SQL, rows)
+                self.conn.execute(
+                    "UPDATE pets SET active = 0 WHERE shop_id = ? AND active = 1 AND last_seen < ?",
+                    (shop_id, now),
+                )
+            self.changes.apply(pending)
+            self.prices.apply(prices)
+            return self.changes.shop_versions.get(shop_id, 0)
+
+    def changes_since(self, since: int, shop_id: Optional[str] = None) -> dict:
+        """
+        since 버전 이후의 변경 (ChangeLog.since)
+        """
+        with self._lock:
+            return self.changes.since(self.conn, since, shop_id)
+
+    def get_pets(self, shop_id: Optional[str] = None, include_inactive: bool = False) -> List[Pet]:
+        """
+        저장된 Pet 조회 (기본: 현재 목록에 있는 것만)
+        """
+        with self._lock:
+            return self._select(shop_id, include_inactive)
+
+    def _select(self, shop_id: Optional[str] = None, include_inactive: bool = False) -> List[Pet]:
+        sql = f"SELECT {SELECT_COLUMNS} FROM pets"
+        conditions = []
+        params = []
+        if shop_id is not None:
+            conditions.append("shop_id = ?")
+            params.append(shop_id)
+        if not include_inactive:
+            conditions.append("active = 1")
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        rows = self.conn.execute(sql, params).fetchall()
+        return [
+            Pet(
+                id=row[0], name=row[1], breed=row[2], age=row[3], gender=row[4],
+                price=row[5], location=row[6], image=row[7], shop=row[8], shopUrl=row[9],
+                shopId=row[10], type=row[11], description=row[12],
+                vaccinated=bool(row[13]), registered=bool(row[14]), crawledAt=row[15],
+                detailUrl=row[16],
+            )
+            for row in rows
+        ]
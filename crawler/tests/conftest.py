@@ -0,0 +1,41 @@
+"""
+테스트 공통 설정 (crawler 폴더를 import 경로에 추가하고 Pet 생성 도우미 제공)
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import Pet  # noqa: E402
+from store import PetStore  # noqa: E402
+
+
+def make_pet(pet_id: str, shop_id: str = "shop-a", price: int = 100000, **fields) -> Pet:
+    values = {
+        "id": pet_id,
+        "name": f"{pet_id} 이름",
+        "breed": "말티즈",
+        "age": "2개월",
+        "gender": "수컷",
+        "price": price,
+        "location": "서울",
+        "image": "",
+        "shop": shop_id,
+        "shopUrl": f"https://{shop_id}.example",
+        "shopId": shop_id,
+        "type": "dog",
+        "description": "",
+        "crawledAt": "2024-01-01T00:00:00",
+    }
+    values.update(fields)
+    return Pet(**values)
+
+
+@pytest.fixture
+def store(tmp_path):
+    pet_store = PetStore(str(tmp_path / "pets.db"))
+    pet_store.open()
+    yield pet_store
+    pet_store.close()
@@ -0,0 +1,94 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from catalog import PetIndex
+from conftest import make_pet
+
+
+@pytest.fixture
+def pets():
+    # 가격이 겹치도록 만들어 (값, id) 커서의 동점 처리를 확인
+    return [
+        make_pet(f"p-{i:02d}", shop_id="shop-a" if i % 2 else "shop-b",
+                 price=(i % 5) * 10000, type="cat" if i % 3 == 0 else "dog")
+        for i in range(23)
+    ]
+
+
+def pages(index, filters=None, **query):
+    ids, cursor = [], None
+    while True:
+        page = index.query(filters or {}, cursor=cursor, **query)
+        ids.extend(pet.id for pet in page["items"])
+        cursor = page["nextCursor"]
+        if cursor is None:
+            return ids, page["total"]
+
+
+@pytest.mark.parametrize("sort", ["price", "-price", "name", "-crawledAt"])
+def test_cursor_paging_matches_full_sort(pets, sort):
+    index = PetIndex()
+    index.load(pets)
+    field = sort.lstrip("-")
+    expected = [pet.id for pet in sorted(pets, key=lambda pet: (getattr(pet, field), pet.id),
+                                         reverse=sort.startswith("-"))]
+    ids, total = pages(index, sort=sort, limit=4)
+    assert ids == expected
+    assert total == len(pets)
+
+
+def test_cursor_paging_with_filters(pets):
+    index = PetIndex()
+    index.load(pets)
+    ids, total = pages(index, {"type": "dog", "shopId": "shop-a"},
+                       min_price=10000, max_price=30000, sort="price", limit=3)
+    expected = sorted(
+        (pet for pet in pets
+         if pet.type == "dog" and pet.shopId == "shop-a" and 10000 <= pet.price <= 30000),
+        key=lambda pet: (pet.price, pet.id),
+    )
+    assert ids == [pet.id for pet in expected]
+    assert total == len(expected)
+
+
+def test_cursor_survives_catalog_change(pets):
+    index = PetIndex()
+    index.load(pets)
+    first = index.query({}, sort="name", limit=5)
+    # 이미 본 항목 앞에 새 Pet이 추가되어도 다음 페이지는 커서 다음부터
+    index.replace_shop("shop-c", [make_pet("p-00a", shop_id="shop-c")])
+    second = index.query({}, sort="name", limit=5, cursor=first["nextCursor"])
+    seen = {pet.id for pet in first["items"]}
+    assert not seen & {pet.id for pet in second["items"]}
+    assert second["items"][0].name > first["items"][-1].name
+
+
+def test_invalid_cursor_and_sort(pets):
+    index = PetIndex()
+    index.load(pets)
+    with pytest.raises(ValueError):
+        index.query({}, cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        index.query({}, sort="breed")
+
+
+def test_list_pets_endpoint_pages_and_etag(pets, monkeypatch):
+    index = PetIndex()
+    index.load(pets)
+    monkeypatch.setattr(main, "pet_index", index)
+    client = TestClient(main.app)
+
+    response = client.get("/api/pets", params={"sort": "price", "limit": 10})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["items"]) == 10 and body["total"] == len(pets)
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    assert client.get("/api/pets", params={"sort": "price", "limit": 10},
+                      headers={"If-None-Match": etag}).status_code == 304
+    following = client.get("/api/pets", params={"sort": "price", "limit": 10,
+                                                "cursor": body["nextCursor"]})
+    assert following.json()["items"][0]["id"] not in {item["id"] for item in body["items"]}
+    assert client.get("/api/pets", params={"cursor": "bad"}).status_code == 400
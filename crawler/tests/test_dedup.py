@@ -0,0 +1,30 @@
+from conftest import make_pet
+from dedup import dedupe_results, find_duplicates
+from models import CrawlResult
+
+DESCRIPTION = "건강하고 활발한 말티즈 남아입니다. 1차 접종 완료, 구충 완료. 방문 상담 환영합니다."
+
+
+def result(shop_id, pets):
+    return CrawlResult(success=True, shopId=shop_id, shopName=shop_id, pets=pets, count=len(pets))
+
+
+def test_same_pet_on_two_shops_is_merged():
+    a = make_pet("a-1", shop_id="shop-a", description=DESCRIPTION, image="https://a.example/img/m123.jpg")
+    b = make_pet("b-1", shop_id="shop-b", price=105000, description=DESCRIPTION,
+                 image="https://b.example/data/m123.jpg")
+    other = make_pet("b-2", shop_id="shop-b", breed="푸들", description="얌전한 푸들 여아, 2차 접종 완료")
+    results, removed = dedupe_results([result("shop-a", [a]), result("shop-b", [b, other])])
+    assert removed == 1
+    assert [alt.id for alt in results[0].pets[0].alternates] == ["b-1"]
+    assert [pet.id for pet in results[1].pets] == ["b-2"]
+    assert results[1].count == 1
+
+
+def test_same_shop_and_different_breed_are_not_merged():
+    pets = [
+        make_pet("a-1", shop_id="shop-a", description=DESCRIPTION),
+        make_pet("a-2", shop_id="shop-a", description=DESCRIPTION),
+        make_pet("b-1", shop_id="shop-b", breed="푸들", description=DESCRIPTION),
+    ]
+    assert find_duplicates(pets) == []
@@ -0,0 +1,108 @@
+import asyncio
+
+import httpx
+import pytest
+
+import engine
+from engine import Attr, ShopSpec, make_soup
+from fetcher import Page
+
+PAGER_HTML = """
+<html><body><div class="page"><div class="page-wrap homepage">
+<a href="/about">회사 소개</a><a href="/board/qna">문의</a>
+<ul class="list"><li><a href="/d/1">말티즈</a></li></ul>
+<div class="xans-product-normalpaging">
+<a href="?cate_no=24&page=2">2</a>
+<a href="/product/list.html?page=3&cate_no=24">3</a>
+<a href="/product/list.html?cate_no=25&page=2">다른 분류</a>
+<a href="/d/1">상세</a>
+</div></div></div></body></html>
+"""
+
+
+def make_spec(**fields) -> ShopSpec:
+    values = dict(
+        shop_id="test-shop", shop_name="Test Shop", base_url="https://shop.example",
+        path="/product/list.html?cate_no=24", containers=("ul.list",), items="li",
+        link=Attr("a", "href"), request_interval=0,
+    )
+    values.update(fields)
+    return ShopSpec(**values)
+
+
+def test_discover_page_urls_only_listing_pages():
+    spec = make_spec()
+    soup = make_soup(spec, PAGER_HTML, mode="full")
+    assert spec.discover_page_urls(soup, spec.url) == [
+        "https://shop.example/product/list.html?cate_no=24&page=2",
+        "https://shop.example/product/list.html?page=3&cate_no=24",
+    ]
+
+
+def test_fast_mode_keeps_only_container_and_pager():
+    spec = make_spec()
+    soup = make_soup(spec, PAGER_HTML, mode="fast")
+    # page/page-wrap/homepage 같은 레이아웃 요소는 트리에 남지 않음
+    assert soup.find(class_="page-wrap") is None
+    assert soup.find(class_="xans-product-normalpaging") is not None
+    assert len(spec.discover_page_urls(soup, spec.url)) == 2
+
+
+def listing(start: int) -> bytes:
+    items = "".join(f'<li><a href="/d/{i}">말티즈 {i}</a></li>' for i in range(start, start + 3))
+    return f'<html><body><ul class="list">{items}</ul></body></html>'.encode()
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """
+    URL -> 본문 (예외를 넣으면 그 페이지 요청이 실패)
+    """
+    responses = {}
+
+    async def fake_fetch_page(url, timeout=None):
+        response = responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return Page(url, response, "utf-8", digest=url)
+
+    monkeypatch.setattr(engine, "fetch_page", fake_fetch_page)
+    monkeypatch.setattr(engine, "ENRICH_ENABLED", False)
+    engine._parsed_pages.clear()
+    yield responses
+    engine._parsed_pages.clear()
+
+
+def test_crawl_spec_merges_pages(pages):
+    spec = make_spec(path="/list", page_url="/list?page={page}", max_pages=3)
+    pages.update({
+        "https://shop.example/list": listing(0),
+        "https://shop.example/list?page=2": listing(3),
+        "https://shop.example/list?page=3": listing(6),
+    })
+    pets = asyncio.run(engine.crawl_spec(spec))
+    assert len(pets) == 9
+
+
+def test_crawl_spec_fails_when_extra_page_fails(pages):
+    spec = make_spec(path="/list", page_url="/list?page={page}", max_pages=3)
+    pages.update({
+        "https://shop.example/list": listing(0),
+        "https://shop.example/list?page=2": httpx.ConnectError("연결 실패"),
+        "https://shop.example/list?page=3": listing(6),
+    })
+    # 일부 페이지만 성공한 결과를 저장하면 나머지 목록이 삭제된 것으로 기록되므로 실패로 처리
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(engine.crawl_spec(spec))
+
+
+def test_parsed_pages_cache_is_bounded(pages, monkeypatch):
+    monkeypatch.setattr(engine, "MAX_CACHED_PAGES", 2)
+    spec = make_spec(path="/list", page_url="/list?page={page}", max_pages=1)
+    for i in range(4):
+        url = f"https://shop.example/list?v={i}"
+        pages[url] = listing(i)
+        asyncio.run(engine.crawl_page(spec, url))
+    assert list(engine._parsed_pages) == [
+        "https://shop.example/list?v=2", "https://shop.example/list?v=3",
+    ]
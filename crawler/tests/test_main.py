@@ -0,0 +1,47 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+import main
+from conftest import make_pet
+
+
+@pytest.fixture
+def crawl(monkeypatch, store):
+    """
+    petfree 크롤러를 pets를 돌려주는 가짜 크롤러로 바꾸고 임시 저장소 사용
+    """
+    result = {"pets": []}
+
+    async def fake_crawler():
+        return result["pets"]
+
+    monkeypatch.setattr(main.crawler_registry, "get", lambda shop_id: fake_crawler)
+    monkeypatch.setattr(main, "pet_store", store)
+    main.result_cache.invalidate()
+    yield result
+    main.result_cache.invalidate()
+
+
+def test_empty_crawl_is_failure_and_not_stored(crawl, store):
+    crawl["pets"] = [make_pet("a-1", shop_id="petfree")]
+    assert asyncio.run(main.crawl_and_cache("petfree")).success
+
+    crawl["pets"] = []
+    result = asyncio.run(main.crawl_and_cache("petfree"))
+    assert not result.success
+    assert {pet.id for pet in store.get_pets("petfree")} == {"a-1"}
+    # 이전 성공 결과가 캐시에 그대로 남음
+    assert main.result_cache.get("petfree").value.count == 1
+
+
+def test_store_error_keeps_crawl_result(crawl, store, monkeypatch):
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "sync_shop", locked)
+    crawl["pets"] = [make_pet("a-1", shop_id="petfree")]
+    result = asyncio.run(main.crawl_and_cache("petfree"))
+    assert result.success and result.version == 0
+    assert main.result_cache.get("petfree").value is result
@@ -0,0 +1,97 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from conftest import make_pet
+from prices import PRICES_SCHEMA, PriceHistory
+
+NOW = 1_700_000_000.0
+DAY = 86400.0
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.executescript("CREATE TABLE pets (id TEXT, shop_id TEXT, breed TEXT, type TEXT);")
+    connection.executescript(PRICES_SCHEMA)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def history(conn):
+    prices = PriceHistory(sample_interval=0)
+    prices.load(conn)
+    return prices
+
+
+def record(history, conn, pets, now):
+    history.apply(history.record(conn, pets, now=now))
+
+
+def test_stats_percentiles_match_numpy(history, conn):
+    rng = np.random.default_rng(7)
+    values = rng.integers(1, 200, size=57) * 10000
+    breeds = ["말티즈", "푸들", "비숑"]
+    record(history, conn, 
+        [make_pet(f"p-{i}", price=int(price), breed=breeds[i % 3]) for i, price in enumerate(values)],
+        NOW - DAY,
+    )
+    stats = history.stats("breed", days=30, percentiles=(10, 50, 90), now=NOW)
+    assert stats["total"] == len(values)
+    for group in stats["groups"]:
+        expected = values[[i for i in range(len(values)) if breeds[i % 3] == group["key"]]]
+        assert group["count"] == len(expected)
+        assert group["min"] == expected.min() and group["max"] == expected.max()
+        assert group["mean"] == round(expected.mean())
+        for q in (10, 50, 90):
+            assert group[f"p{q}"] == round(np.percentile(expected, q))
+
+
+def test_stats_uses_latest_price_in_window(history, conn):
+    record(history, conn, [make_pet("p-1", price=100000)], NOW - 40 * DAY)
+    record(history, conn, [make_pet("p-1", price=200000)], NOW - 10 * DAY)
+    record(history, conn, [make_pet("p-1", price=300000)], NOW - DAY)
+
+    group = history.stats("breed", days=30, now=NOW)["groups"][0]
+    assert group["count"] == 1 and group["p50"] == 300000
+    # 기간 밖의 관측값은 제외
+    assert history.stats("breed", days=30, now=NOW - 5 * DAY)["groups"][0]["p50"] == 200000
+    assert history.stats("breed", days=1, now=NOW - 20 * DAY)["total"] == 0
+
+
+def test_stats_filters_and_groups(history, conn):
+    record(history, conn, [
+        make_pet("a-1", shop_id="shop-a", price=100000, type="dog"),
+        make_pet("a-2", shop_id="shop-a", price=300000, type="cat", breed="페르시안"),
+        make_pet("b-1", shop_id="shop-b", price=500000, type="dog"),
+    ], NOW)
+    by_shop = history.stats("shopId", days=1, filters={"type": "dog"}, now=NOW)
+    assert {group["key"]: group["count"] for group in by_shop["groups"]} == {"shop-a": 1, "shop-b": 1}
+    assert history.stats("type", days=1, filters={"breed": "없는품종"}, now=NOW)["total"] == 0
+
+
+def test_stats_huge_window_starts_at_epoch(history, conn):
+    record(history, conn, [make_pet("p-1")], NOW)
+    for days in (1e12, float("inf")):
+        stats = history.stats("breed", days=days, now=NOW)
+        assert stats["total"] == 1
+        assert stats["from"].startswith("1970-01-01")
+
+
+def test_stats_rejects_bad_arguments(history):
+    with pytest.raises(ValueError):
+        history.stats("price")
+    with pytest.raises(ValueError):
+        history.stats("breed", percentiles=(150,))
+
+
+def test_record_samples_unchanged_prices(conn):
+    prices = PriceHistory(sample_interval=3600)
+    prices.load(conn)
+    prices.apply(prices.record(conn, [make_pet("p-1")], now=NOW))
+    # 같은 가격은 간격 안에서 다시 기록하지 않고, 바뀐 가격은 바로 기록
+    assert prices.record(conn, [make_pet("p-1")], now=NOW + 60) is None
+    prices.apply(prices.record(conn, [make_pet("p-1", price=90000)], now=NOW + 120))
+    assert [entry["price"] for entry in prices.history("p-1")] == [100000, 90000]
@@ -0,0 +1,44 @@
+import asyncio
+
+from scheduler import CrawlScheduler
+
+
+def test_same_key_shares_one_run():
+    calls = []
+
+    async def job():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def run():
+        scheduler = CrawlScheduler(max_concurrency=2)
+        await scheduler.start()
+        try:
+            return await asyncio.gather(*(scheduler.submit("shop", "host", job) for _ in range(5)))
+        finally:
+            await scheduler.stop()
+
+    assert asyncio.run(run()) == [1] * 5
+    assert len(calls) == 1
+
+
+def test_per_host_limit():
+    active, peak = [0], [0]
+
+    async def job():
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+
+    async def run():
+        scheduler = CrawlScheduler(max_concurrency=4, per_host_limit=1)
+        await scheduler.start()
+        try:
+            await asyncio.gather(*(scheduler.submit(f"shop-{i}", "same-host", job) for i in range(4)))
+        finally:
+            await scheduler.stop()
+
+    asyncio.run(run())
+    assert peak[0] == 1
@@ -0,0 +1,66 @@
+import sqlite3
+
+import store as store_module
+from conftest import make_pet
+
+
+def active_ids(store, shop_id="shop-a"):
+    return {pet.id for pet in store.get_pets(shop_id)}
+
+
+def test_sync_shop_deactivates_missing_pets(store):
+    assert store.sync_shop("shop-a", [make_pet("a-1"), make_pet("a-2")]) == 1
+    assert store.sync_shop("shop-a", [make_pet("a-1")]) == 2
+    assert active_ids(store) == {"a-1"}
+    assert {pet.id for pet in store.get_pets("shop-a", include_inactive=True)} == {"a-1", "a-2"}
+    assert store.changes_since(1)["shops"]["shop-a"]["removed"] == ["a-2"]
+
+
+def test_sync_shop_unchanged_keeps_version(store):
+    pets = [make_pet("a-1"), make_pet("a-2")]
+    assert store.sync_shop("shop-a", pets) == 1
+    assert store.sync_shop("shop-a", pets) == 1
+    assert store.changes.version == 1
+
+
+def test_sync_shop_empty_list_keeps_catalog(store):
+    store.sync_shop("shop-a", [make_pet("a-1"), make_pet("a-2")])
+    assert store.sync_shop("shop-a", []) == 1
+    assert active_ids(store) == {"a-1", "a-2"}
+    assert store.changes_since(1)["shops"] == {}
+
+
+def test_sync_shop_other_shops_untouched(store):
+    store.sync_shop("shop-a", [make_pet("a-1")])
+    store.sync_shop("shop-b", [make_pet("b-1", shop_id="shop-b")])
+    store.sync_shop("shop-a", [make_pet("a-2")])
+    assert active_ids(store, "shop-b") == {"b-1"}
+
+
+def test_sync_shop_rollback_keeps_memory_state(store, monkeypatch):
+    store.sync_shop("shop-a", [make_pet("a-1", price=100000)])
+    monkeypatch.setattr(store_module, "UPSERT_SQL", "INSERT INTO missing_table VALUES (1)")
+    try:
+        store.sync_shop("shop-a", [make_pet("a-1", price=200000), make_pet("a-2")])
+    except sqlite3.Error:
+        pass
+    else:
+        raise AssertionError("sync_shop should fail")
+    assert store.changes.version == 1
+    assert store.changes.shop_versions == {"shop-a": 1}
+    assert len(store.prices) == 1
+
+    monkeypatch.undo()
+    assert store.sync_shop("shop-a", [make_pet("a-1", price=200000), make_pet("a-2")]) == 2
+    assert len(store.prices) == 3
+    assert store.conn.execute("SELECT COUNT(*) FROM price_history").fetchone()[0] == 3
+
+
+def test_changes_since_merges_versions(store):
+    store.sync_shop("shop-a", [make_pet("a-1", price=100000)])
+    store.sync_shop("shop-a", [make_pet("a-1", price=150000), make_pet("a-2")])
+    store.sync_shop("shop-a", [make_pet("a-1", price=200000)])
+    shop = store.changes_since(1)["shops"]["shop-a"]
+    # a-2는 since 이후에 추가되었다가 삭제되었으므로 생략, 가격은 처음 이전 값 -> 마지막 새 값
+    assert shop["added"] == [] and shop["removed"] == []
+    assert shop["changed"][0]["fields"]["price"] == {"old": 100000, "new": 200000}
@@ -1,4 +1,14 @@
 // 반려동물 데이터 타입 정의
+// 다른 샵에 올라온 같은 동물 (중복 제거 시 대표 Pet에 포함)
+export interface PetAlternate {
+  id: string
+  shop: string
+  shopId: string
+  shopUrl: string
+  price: number
+  detailUrl?: string
+}
+
 export interface Pet {
   id: string
   name: string
@@ -16,6 +26,11 @@ export interface Pet {
   vaccinated: boolean
   registered: boolean
   crawledAt: string
+  detailUrl?: string
+  // 크롤러 서버의 로컬 썸네일 주소 (이미지 캐시를 켠 경우, 예: /api/images/{key})
+  thumbnail?: string
+  // 다른 샵의 같은 동물 (dedupe=true일 때 대표 Pet에만 채워짐)
+  alternates?: PetAlternate[]
 }
 
 export interface CrawlResult {
@@ -25,4 +40,8 @@ export interface CrawlResult {
   pets: Pet[]
   error?: string
   count: number
+  // 마감 시간(deadline) 안에 끝나지 않아 그때까지 파싱한 Pet만 담은 결과
+  partial?: boolean
+  // 이 결과에 반영된 샵의 마지막 변경 버전 (/api/changes?since=)
+  version?: number
 }